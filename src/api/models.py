@@ -1,12 +1,17 @@
 """API request and response models."""
 
-import base64
+import asyncio
+from functools import cached_property
 from typing import Any
 
-from pydantic import BaseModel, Field
+import pybase64
+from pydantic import BaseModel, Field, PrivateAttr, computed_field
 
 from src.config import LLMProvider, OCRProvider
 
+# Responses with filled PDFs larger than this are serialized off the event loop
+LARGE_PDF_BYTES = 1024 * 1024
+
 
 class ProcessRequestParams(BaseModel):
     """Query parameters for process request.
@@ -47,12 +52,6 @@ class ProcessResponse(BaseModel):
         description="Structured data extracted from the document"
     )
 
-    # Filled PDF (base64 encoded)
-    filled_pdf_base64: str | None = Field(
-        default=None,
-        description="Filled PDF as base64-encoded string (if input was PDF)",
-    )
-
     # Confidence scores
     confidence_score: float = Field(
         ge=0.0,
@@ -83,23 +82,31 @@ class ProcessResponse(BaseModel):
         description="Additional processing metadata",
     )
 
+    # Raw filled PDF, only base64-encoded when the response is serialized
+    _filled_pdf: bytes | None = PrivateAttr(default=None)
+
+    @computed_field(description="Filled PDF as base64-encoded string (if input was PDF)")
+    @cached_property
+    def filled_pdf_base64(self) -> str | None:
+        """Filled PDF as a base64 string, encoded on first access."""
+        if not self._filled_pdf:
+            return None
+        return pybase64.b64encode_as_string(self._filled_pdf)
+
     @classmethod
     def from_process_result(cls, result) -> "ProcessResponse":
         """Create response from ProcessResult.
 
+        The values come from our own pipeline, so validation is skipped.
+
         Args:
             result: ProcessResult from pipeline
 
         Returns:
             ProcessResponse instance
         """
-        filled_pdf_b64 = None
-        if result.filled_pdf:
-            filled_pdf_b64 = base64.b64encode(result.filled_pdf).decode("utf-8")
-
-        return cls(
+        response = cls.model_construct(
             extracted_data=result.extracted_data,
-            filled_pdf_base64=filled_pdf_b64,
             confidence_score=result.overall_confidence,
             ocr_confidence=result.ocr_confidence,
             llm_confidence=result.llm_confidence,
@@ -107,6 +114,21 @@ class ProcessResponse(BaseModel):
             processing_time_ms=result.processing_time_ms,
             metadata=result.metadata,
         )
+        response._filled_pdf = result.filled_pdf
+        return response
+
+    async def model_dump_json_async(self) -> str:
+        """Serialize to JSON without blocking the event loop.
+
+        Large filled PDFs are encoded in a worker thread; small ones are
+        encoded inline since the thread hop would cost more than the encode.
+
+        Returns:
+            JSON string of the response
+        """
+        if self._filled_pdf and len(self._filled_pdf) > LARGE_PDF_BYTES:
+            return await asyncio.to_thread(self.model_dump_json)
+        return self.model_dump_json()
 
 
 class HealthResponse(BaseModel):
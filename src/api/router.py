@@ -1,21 +1,213 @@
 """API router - FastAPI endpoints."""
 
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile
+import asyncio
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+import orjson
+import pybase64
+from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
 from fastapi.responses import Response
 
 from src import __version__
 from src.api.models import ErrorResponse, HealthResponse, ProcessResponse
 from src.config import LLMProvider, OCRProvider, get_settings
-from src.ocr.mistral_document_ocr import MistralDocumentOCR
-from src.pdf.generator import generate_pdf
-from src.pdf.markdown_to_pdf import ocr_text_to_pdf
-from src.pipeline.processor import PipelineError, PipelineProcessor
-from src.pipeline.simple_processor import SimplePipeline
 from src.utils.logging import get_logger
 
+# Pipeline modules pull in the provider SDKs and PDF libraries, so they are
+# imported on first use rather than when the app starts
+if TYPE_CHECKING:
+    from src.ocr.mistral_document_ocr import MistralDocumentOCR
+    from src.pipeline.processor import PipelineProcessor
+    from src.pipeline.simple_processor import SimplePipeline
+
 logger = get_logger(__name__)
 
-router = APIRouter(prefix="/api/v1", tags=["Medical OCR Pipeline"])
+router = APIRouter(
+    prefix="/api/v1",
+    tags=["Medical OCR Pipeline"],
+)
+
+_ALLOWED_EXT = frozenset({".pdf", ".jpg", ".jpeg", ".png", ".heic", ".heif"})
+
+# Uploads above this size are rejected before being read into memory
+MAX_UPLOAD_BYTES = 100 * 1024 * 1024
+
+
+@lru_cache(maxsize=1)
+def _get_processor() -> "PipelineProcessor":
+    """Get the shared pipeline processor instance."""
+    from src.pipeline.processor import PipelineProcessor
+
+    return PipelineProcessor()
+
+
+@lru_cache(maxsize=1)
+def _get_simple_pipeline() -> "SimplePipeline":
+    """Get the shared simplified pipeline instance."""
+    from src.pipeline.simple_processor import SimplePipeline
+
+    return SimplePipeline()
+
+
+@lru_cache(maxsize=1)
+def _get_document_ocr() -> "MistralDocumentOCR":
+    """Get the shared Mistral Document OCR client."""
+    from src.ocr.mistral_document_ocr import MistralDocumentOCR
+
+    return MistralDocumentOCR()
+
+
+def _check_ext(filename: str) -> str:
+    """Validate the extension of an uploaded source file.
+
+    Args:
+        filename: Uploaded filename
+
+    Returns:
+        Lowercased file extension including the dot
+
+    Raises:
+        HTTPException: If the extension is not supported
+    """
+    ext = os.path.splitext(filename)[1].lower()
+    if ext not in _ALLOWED_EXT:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported file type: {ext}. Allowed: {', '.join(sorted(_ALLOWED_EXT))}",
+        )
+    return ext
+
+
+async def _read_upload(upload: UploadFile) -> bytes:
+    """Read an uploaded file and release its spooled buffer.
+
+    The pipeline stages (PyMuPDF, pypdf, Pillow, base64) all need one
+    contiguous buffer, so the upload is materialized exactly once. Closing
+    the upload straight away frees the spooled copy instead of holding it
+    for the whole (potentially minutes-long) pipeline run.
+
+    Args:
+        upload: Uploaded file from the request
+
+    Returns:
+        File content as bytes
+
+    Raises:
+        HTTPException: If the upload exceeds MAX_UPLOAD_BYTES
+    """
+    if upload.size is not None and upload.size > MAX_UPLOAD_BYTES:
+        await upload.close()
+        raise HTTPException(
+            status_code=413,
+            detail=f"File too large. Maximum size is {MAX_UPLOAD_BYTES // (1024 * 1024)} MB",
+        )
+
+    try:
+        return await upload.read()
+    finally:
+        await upload.close()
+
+
+@dataclass
+class UploadBundle:
+    """Validated upload contents for a processing request.
+
+    Attributes:
+        filename: Original filename of the source document
+        content: Source document bytes
+        template: Optional blank PDF template bytes
+    """
+
+    filename: str
+    content: bytes
+    template: bytes | None = None
+
+    @property
+    def base_name(self) -> str:
+        """Source filename without its extension, for naming outputs."""
+        return os.path.splitext(self.filename)[0]
+
+
+async def load_source(
+    file: UploadFile = File(
+        ..., description="Source document to extract data from (scanned form, image, or PDF)"
+    ),
+) -> UploadBundle:
+    """Validate and read the uploaded source document.
+
+    Args:
+        file: Uploaded source document
+
+    Returns:
+        UploadBundle with the source content
+
+    Raises:
+        HTTPException: If the file is missing a name, unsupported, too large or empty
+    """
+    if not file.filename:
+        raise HTTPException(status_code=400, detail="Filename is required")
+
+    _check_ext(file.filename)
+
+    try:
+        content = await _read_upload(file)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Failed to read uploaded file", error=str(e))
+        raise HTTPException(status_code=400, detail="Failed to read uploaded file")
+
+    if not content:
+        raise HTTPException(status_code=400, detail="Empty file uploaded")
+
+    return UploadBundle(filename=file.filename, content=content)
+
+
+async def load_upload(
+    source: UploadBundle = Depends(load_source),
+    template_pdf: UploadFile | None = File(
+        default=None,
+        description="Optional: Blank PDF template with AcroForm fields to fill with extracted data",
+    ),
+) -> UploadBundle:
+    """Validate and read the source document plus an optional template PDF.
+
+    Args:
+        source: Validated source document
+        template_pdf: Optional blank PDF template
+
+    Returns:
+        UploadBundle with source and template content
+
+    Raises:
+        HTTPException: If the template is not a PDF, too large or empty
+    """
+    if not template_pdf or not template_pdf.filename:
+        return source
+
+    if not template_pdf.filename.lower().endswith(".pdf"):
+        raise HTTPException(
+            status_code=400,
+            detail="Template must be a PDF file with AcroForm fields",
+        )
+
+    try:
+        template = await _read_upload(template_pdf)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Failed to read template file", error=str(e))
+        raise HTTPException(status_code=400, detail="Failed to read template file")
+
+    if not template:
+        raise HTTPException(status_code=400, detail="Empty template file")
+
+    logger.info("Template PDF provided", template_filename=template_pdf.filename)
+    source.template = template
+    return source
 
 
 @router.get(
@@ -63,13 +255,7 @@ async def health_check() -> HealthResponse:
     """,
 )
 async def process_document(
-    file: UploadFile = File(
-        ..., description="Source document to extract data from (scanned form, image, or PDF)"
-    ),
-    template_pdf: UploadFile | None = File(
-        default=None,
-        description="Optional: Blank PDF template with AcroForm fields to fill with extracted data",
-    ),
+    upload: UploadBundle = Depends(load_upload),
     ocr_provider: OCRProvider = Form(
         default=OCRProvider.MISTRAL,
         description="OCR provider: mistral, gemini, or google_docai",
@@ -78,64 +264,20 @@ async def process_document(
         default=LLMProvider.GEMINI,
         description="LLM provider: gemini or openai",
     ),
-) -> ProcessResponse:
+) -> Response:
     """Process a document through the OCR → LLM → PDF filling pipeline.
 
     Args:
-        file: Uploaded source document to extract data from
-        template_pdf: Optional blank PDF template to fill with extracted data
+        upload: Validated source document and optional template PDF
         ocr_provider: OCR provider to use (toggle)
         llm_provider: LLM provider to use (toggle)
 
     Returns:
-        ProcessResponse with extracted data and confidence scores
+        JSON-encoded ProcessResponse with extracted data and confidence scores
 
     Raises:
         HTTPException: On validation or processing errors
     """
-    # Validate source file
-    if not file.filename:
-        raise HTTPException(status_code=400, detail="Filename is required")
-
-    # Validate source file extension
-    allowed_extensions = {".pdf", ".jpg", ".jpeg", ".png", ".heic", ".heif"}
-    file_ext = "." + file.filename.rsplit(".", 1)[-1].lower() if "." in file.filename else ""
-
-    if file_ext not in allowed_extensions:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Unsupported file type: {file_ext}. Allowed: {', '.join(allowed_extensions)}",
-        )
-
-    # Read source file content
-    try:
-        file_content = await file.read()
-    except Exception as e:
-        logger.error("Failed to read uploaded file", error=str(e))
-        raise HTTPException(status_code=400, detail="Failed to read uploaded file")
-
-    if not file_content:
-        raise HTTPException(status_code=400, detail="Empty file uploaded")
-
-    # Read template PDF if provided
-    template_content: bytes | None = None
-    if template_pdf and template_pdf.filename:
-        if not template_pdf.filename.lower().endswith(".pdf"):
-            raise HTTPException(
-                status_code=400,
-                detail="Template must be a PDF file with AcroForm fields",
-            )
-        try:
-            template_content = await template_pdf.read()
-            if not template_content:
-                raise HTTPException(status_code=400, detail="Empty template file")
-            logger.info("Template PDF provided", template_filename=template_pdf.filename)
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error("Failed to read template file", error=str(e))
-            raise HTTPException(status_code=400, detail="Failed to read template file")
-
     # Validate provider configuration
     settings = get_settings()
     try:
@@ -147,24 +289,32 @@ async def process_document(
     # Process document
     logger.info(
         "Processing document",
-        filename=file.filename,
-        file_size=len(file_content),
-        has_template=template_content is not None,
+        filename=upload.filename,
+        file_size=len(upload.content),
+        has_template=upload.template is not None,
         ocr_provider=ocr_provider.value,
         llm_provider=llm_provider.value,
     )
 
+    from src.pipeline.processor import PipelineError
+
     try:
-        processor = PipelineProcessor()
+        processor = _get_processor()
         result = await processor.process(
-            file_content=file_content,
-            filename=file.filename,
+            file_content=upload.content,
+            filename=upload.filename,
             ocr_provider=ocr_provider,
             llm_provider=llm_provider,
-            template_pdf=template_content,
+            template_pdf=upload.template,
         )
 
-        return ProcessResponse.from_process_result(result)
+        # Serialize with pydantic-core directly; returning the model would make
+        # FastAPI re-validate and re-encode it against response_model
+        response = ProcessResponse.from_process_result(result)
+        return Response(
+            content=await response.model_dump_json_async(),
+            media_type="application/json",
+        )
 
     except PipelineError as e:
         logger.error("Pipeline processing failed", error=str(e), stage=e.stage)
@@ -189,17 +339,39 @@ async def list_providers() -> dict:
     """List available OCR and LLM providers."""
     settings = get_settings()
 
+    return _providers_payload(
+        mistral=bool(settings.mistral_api_key),
+        gemini=bool(settings.gemini_api_key),
+        openai=bool(settings.openai_api_key),
+    )
+
+
+@lru_cache(maxsize=8)
+def _providers_payload(mistral: bool, gemini: bool, openai: bool) -> dict:
+    """Build the provider listing for a given set of configured API keys.
+
+    The listing only depends on which keys are set, so one payload is built
+    per combination and shared across requests. Callers must not mutate it.
+
+    Args:
+        mistral: Whether a Mistral API key is configured
+        gemini: Whether a Gemini API key is configured
+        openai: Whether an OpenAI API key is configured
+
+    Returns:
+        Provider listing response body
+    """
     return {
         "ocr_providers": [
             {
                 "id": OCRProvider.MISTRAL.value,
                 "name": "Mistral Document AI",
-                "available": bool(settings.mistral_api_key),
+                "available": mistral,
             },
             {
                 "id": OCRProvider.GEMINI.value,
                 "name": "Gemini Vision",
-                "available": bool(settings.gemini_api_key),
+                "available": gemini,
             },
             {
                 "id": OCRProvider.GOOGLE_DOCAI.value,
@@ -212,12 +384,12 @@ async def list_providers() -> dict:
             {
                 "id": LLMProvider.GEMINI.value,
                 "name": "Gemini",
-                "available": bool(settings.gemini_api_key),
+                "available": gemini,
             },
             {
                 "id": LLMProvider.OPENAI.value,
                 "name": "OpenAI GPT-4",
-                "available": bool(settings.openai_api_key),
+                "available": openai,
             },
         ],
     }
@@ -242,11 +414,7 @@ async def list_providers() -> dict:
     """,
 )
 async def process_and_download(
-    file: UploadFile = File(..., description="Source document to extract data from"),
-    template_pdf: UploadFile | None = File(
-        default=None,
-        description="Optional: Blank PDF template to fill with extracted data",
-    ),
+    upload: UploadBundle = Depends(load_upload),
     ocr_provider: OCRProvider = Form(
         default=OCRProvider.MISTRAL,
         description="OCR provider: mistral, gemini, or google_docai",
@@ -257,31 +425,6 @@ async def process_and_download(
     ),
 ) -> Response:
     """Process document and return filled PDF as download."""
-    # Validate source file
-    if not file.filename:
-        raise HTTPException(status_code=400, detail="Filename is required")
-
-    allowed_extensions = {".pdf", ".jpg", ".jpeg", ".png", ".heic", ".heif"}
-    file_ext = "." + file.filename.rsplit(".", 1)[-1].lower() if "." in file.filename else ""
-
-    if file_ext not in allowed_extensions:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Unsupported file type: {file_ext}",
-        )
-
-    # Read source file
-    file_content = await file.read()
-    if not file_content:
-        raise HTTPException(status_code=400, detail="Empty file uploaded")
-
-    # Read template if provided
-    template_content: bytes | None = None
-    if template_pdf and template_pdf.filename:
-        if not template_pdf.filename.lower().endswith(".pdf"):
-            raise HTTPException(status_code=400, detail="Template must be a PDF file")
-        template_content = await template_pdf.read()
-
     # Validate providers
     settings = get_settings()
     settings.validate_ocr_provider(ocr_provider)
@@ -289,18 +432,20 @@ async def process_and_download(
 
     logger.info(
         "Processing document for download",
-        filename=file.filename,
-        has_template=template_content is not None,
+        filename=upload.filename,
+        has_template=upload.template is not None,
     )
 
+    from src.pipeline.processor import PipelineError
+
     try:
-        processor = PipelineProcessor()
+        processor = _get_processor()
         result = await processor.process(
-            file_content=file_content,
-            filename=file.filename,
+            file_content=upload.content,
+            filename=upload.filename,
             ocr_provider=ocr_provider,
             llm_provider=llm_provider,
-            template_pdf=template_content,
+            template_pdf=upload.template,
         )
 
         if not result.filled_pdf:
@@ -310,8 +455,7 @@ async def process_and_download(
             )
 
         # Generate output filename
-        base_name = file.filename.rsplit(".", 1)[0] if "." in file.filename else file.filename
-        output_filename = f"{base_name}_filled.pdf"
+        output_filename = f"{upload.base_name}_filled.pdf"
 
         logger.info("Returning filled PDF", filename=output_filename)
 
@@ -354,46 +498,27 @@ async def process_and_download(
     - 10-30 seconds for 14 pages (vs 7+ minutes with old endpoint)
     """,
 )
-async def process_fast(
-    file: UploadFile = File(..., description="Source document (PDF or image)"),
-    template_pdf: UploadFile | None = File(
-        default=None,
-        description="Blank PDF template to fill with extracted data",
-    ),
-) -> Response:
+async def process_fast(upload: UploadBundle = Depends(load_upload)) -> Response:
     """Fast document processing using Mistral's dedicated OCR API."""
-    if not file.filename:
-        raise HTTPException(status_code=400, detail="Filename is required")
-
-    # Read source file
-    file_content = await file.read()
-    if not file_content:
-        raise HTTPException(status_code=400, detail="Empty file uploaded")
-
-    # Read template if provided
-    template_content: bytes | None = None
-    if template_pdf and template_pdf.filename:
-        template_content = await template_pdf.read()
-
     logger.info(
         "Fast processing",
-        filename=file.filename,
-        file_size=len(file_content),
-        has_template=template_content is not None,
+        filename=upload.filename,
+        file_size=len(upload.content),
+        has_template=upload.template is not None,
     )
 
     try:
-        pipeline = SimplePipeline()
+        pipeline = _get_simple_pipeline()
         result = await pipeline.process(
-            source_document=file_content,
-            source_filename=file.filename,
-            template_pdf=template_content,
+            source_document=upload.content,
+            source_filename=upload.filename,
+            template_pdf=upload.template,
         )
 
         if not result.filled_pdf:
             # Return JSON with extracted data if no PDF generated
             return Response(
-                content=str(result.extracted_data).encode(),
+                content=orjson.dumps(result.extracted_data),
                 media_type="application/json",
                 headers={
                     "X-Extracted-Fields": str(result.field_count),
@@ -402,8 +527,7 @@ async def process_fast(
             )
 
         # Generate output filename
-        base_name = file.filename.rsplit(".", 1)[0] if "." in file.filename else file.filename
-        output_filename = f"{base_name}_filled.pdf"
+        output_filename = f"{upload.base_name}_filled.pdf"
 
         logger.info(
             "Fast processing complete",
@@ -450,30 +574,20 @@ async def process_fast(
     **Best for:** Quick digitization of handwritten forms.
     """,
 )
-async def process_and_generate(
-    file: UploadFile = File(..., description="Scanned form (PDF or image)"),
-) -> Response:
+async def process_and_generate(upload: UploadBundle = Depends(load_source)) -> Response:
     """Extract data from form and generate a clean structured PDF."""
-    if not file.filename:
-        raise HTTPException(status_code=400, detail="Filename is required")
-
-    # Read source file
-    file_content = await file.read()
-    if not file_content:
-        raise HTTPException(status_code=400, detail="Empty file uploaded")
-
     logger.info(
         "Generate PDF request",
-        filename=file.filename,
-        file_size=len(file_content),
+        filename=upload.filename,
+        file_size=len(upload.content),
     )
 
     try:
         # Step 1: Extract document using Mistral's basic OCR (preserves structure)
-        ocr = MistralDocumentOCR()
+        ocr = _get_document_ocr()
         ocr_result = await ocr.process_with_basic_ocr(
-            file_content=file_content,
-            filename=file.filename,
+            file_content=upload.content,
+            filename=upload.filename,
         )
 
         logger.info(
@@ -488,15 +602,17 @@ async def process_and_generate(
                 detail="No content could be extracted from the document",
             )
 
+        from src.pdf.markdown_to_pdf import ocr_text_to_pdf
+
         # Step 2: Convert markdown to PDF (preserves original structure)
-        pdf_bytes = ocr_text_to_pdf(
+        pdf_bytes = await asyncio.to_thread(
+            ocr_text_to_pdf,
             raw_text=ocr_result.raw_text,
             title="Medical Intake Form - Digitized",
         )
 
         # Generate output filename
-        base_name = file.filename.rsplit(".", 1)[0] if "." in file.filename else file.filename
-        output_filename = f"{base_name}_digitized.pdf"
+        output_filename = f"{upload.base_name}_digitized.pdf"
 
         logger.info(
             "PDF generation complete",
@@ -534,32 +650,20 @@ async def process_and_generate(
     **Best for:** Preview before download, editing markdown.
     """,
 )
-async def process_and_preview(
-    file: UploadFile = File(..., description="Scanned form (PDF or image)"),
-) -> dict:
+async def process_and_preview(upload: UploadBundle = Depends(load_source)) -> dict:
     """Extract data and return markdown + PDF for preview."""
-    import base64
-
-    if not file.filename:
-        raise HTTPException(status_code=400, detail="Filename is required")
-
-    # Read source file
-    file_content = await file.read()
-    if not file_content:
-        raise HTTPException(status_code=400, detail="Empty file uploaded")
-
     logger.info(
         "Preview request",
-        filename=file.filename,
-        file_size=len(file_content),
+        filename=upload.filename,
+        file_size=len(upload.content),
     )
 
     try:
         # Step 1: Extract document using Mistral's basic OCR
-        ocr = MistralDocumentOCR()
+        ocr = _get_document_ocr()
         ocr_result = await ocr.process_with_basic_ocr(
-            file_content=file_content,
-            filename=file.filename,
+            file_content=upload.content,
+            filename=upload.filename,
         )
 
         logger.info(
@@ -574,20 +678,20 @@ async def process_and_preview(
                 detail="No content could be extracted from the document",
             )
 
+        from src.pdf.markdown_to_pdf import ocr_text_to_pdf
+
         # Step 2: Convert markdown to PDF
-        pdf_bytes = ocr_text_to_pdf(
+        pdf_bytes = await asyncio.to_thread(
+            ocr_text_to_pdf,
             raw_text=ocr_result.raw_text,
             title="Medical Intake Form - Digitized",
         )
 
-        # Generate output filename
-        base_name = file.filename.rsplit(".", 1)[0] if "." in file.filename else file.filename
-
         return {
             "raw_markdown": ocr_result.raw_text,
-            "pdf_base64": base64.b64encode(pdf_bytes).decode("utf-8"),
+            "pdf_base64": pybase64.b64encode_as_string(pdf_bytes),
             "page_count": ocr_result.page_count,
-            "filename": f"{base_name}_digitized.pdf",
+            "filename": f"{upload.base_name}_digitized.pdf",
         }
 
     except HTTPException:
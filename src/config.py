@@ -58,6 +58,27 @@ class Settings(BaseSettings):
     default_ocr_provider: OCRProvider = OCRProvider.MISTRAL
     default_llm_provider: LLMProvider = LLMProvider.GEMINI
 
+    # LLM rate limits per provider (0 disables a limit)
+    gemini_rpm: int = 1000
+    gemini_tpm: int = 1_000_000
+    openai_rpm: int = 500
+    openai_tpm: int = 450_000
+    max_concurrent_llm: int = 8
+    vision_concurrency: int = 4
+    ocr_concurrency: int = 8
+    # File-to-image conversions running at once. PDFium is not thread-safe, so
+    # in-thread PDF work still runs one at a time; higher values only let image
+    # conversions and process-pool PDF renders overlap.
+    conversion_concurrency: int = 1
+    # Documents the simplified pipeline processes at once; the rest wait their turn
+    max_concurrent_documents: int = 32
+
+    # Result caching (in-memory only, disabled by default)
+    llm_cache_enabled: bool = False
+    llm_cache_size: int = 128
+    ocr_cache_enabled: bool = False
+    ocr_cache_size: int = 256
+
     @property
     def is_production(self) -> bool:
         """Check if running in production."""
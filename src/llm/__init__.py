@@ -1,12 +1,13 @@
 """LLM package - Abstract base and provider implementations for text parsing."""
 
-from src.llm.base import BaseLLM, LLMError, ParseResult
+from src.llm.base import BaseLLM, LLMError, ParseResult, StructuredLLMBase
 from src.llm.factory import create_llm_provider
 from src.llm.gemini_llm import GeminiLLM
 from src.llm.openai_llm import OpenAILLM
 
 __all__ = [
     "BaseLLM",
+    "StructuredLLMBase",
     "ParseResult",
     "LLMError",
     "GeminiLLM",
@@ -1,14 +1,38 @@
 """Base LLM interface - Abstract class for all LLM parsing providers."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any
 
+import orjson
 
-@dataclass
+from src.config import get_settings
+from src.llm.cache import get_parse_cache, parse_cache_key
+from src.llm.json_utils import strip_fences
+from src.llm.prompts import (
+    EXTRACTION_SYSTEM_PROMPT,
+    get_batch_extraction_prompt,
+    get_extraction_prompt,
+)
+from src.llm.rate_limiter import AsyncLeakyBucket
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Rough characters-per-token ratio used to budget prompt size without a tokenizer
+CHARS_PER_TOKEN = 4
+
+# Shared read-only default for responses without confidences
+_EMPTY_CONFIDENCES: dict = {}
+
+
+@dataclass(slots=True, frozen=True)
 class ParseResult:
     """Result from LLM parsing.
 
+    Results are immutable once a provider has built them.
+
     Attributes:
         data: Extracted structured data as dictionary
         field_confidences: Confidence score per field (0.0 to 1.0)
@@ -57,6 +81,9 @@ class BaseLLM(ABC):
         - Avoid storing extracted data to disk
     """
 
+    # Most OCR text sent to the model per request, in estimated tokens
+    MAX_INPUT_TOKENS = 100_000
+
     @abstractmethod
     async def parse_to_json(
         self,
@@ -77,6 +104,120 @@ class BaseLLM(ABC):
         """
         pass
 
+    async def parse_many_to_json(
+        self,
+        ocr_texts: list[str],
+        field_hints: list[str] | None = None,
+    ) -> list[ParseResult]:
+        """Parse several OCR texts into structured JSON.
+
+        The default implementation parses each text separately. Providers
+        override this to send several documents per API request.
+
+        Args:
+            ocr_texts: Raw texts from OCR extraction, one per document
+            field_hints: Optional list of expected field names to guide extraction
+
+        Returns:
+            ParseResults in the same order as ocr_texts
+
+        Raises:
+            LLMError: If parsing fails
+        """
+        return [await self.parse_to_json(text, field_hints) for text in ocr_texts]
+
+    async def parse_batch(
+        self,
+        ocr_texts: list[str],
+        field_hints: list[str] | None = None,
+    ) -> list[ParseResult]:
+        """Parse several OCR texts concurrently, one request per text.
+
+        At most settings.max_concurrent_llm requests are in flight at once;
+        provider rate limits still apply to each request.
+
+        Args:
+            ocr_texts: Raw texts from OCR extraction, one per document
+            field_hints: Optional list of expected field names to guide extraction
+
+        Returns:
+            ParseResults in the same order as ocr_texts
+
+        Raises:
+            LLMError: If parsing any text fails
+        """
+        semaphore = asyncio.Semaphore(get_settings().max_concurrent_llm)
+
+        async def parse_bounded(text: str) -> ParseResult:
+            async with semaphore:
+                return await self.parse_to_json(text, field_hints)
+
+        return list(await asyncio.gather(*(parse_bounded(text) for text in ocr_texts)))
+
+    def _truncate_ocr_text(self, ocr_text: str, max_tokens: int | None = None) -> str:
+        """Cut OCR text down to the input token budget.
+
+        Token counts are estimated at CHARS_PER_TOKEN characters per token, so
+        pathological OCR output fails fast instead of costing an oversized call.
+
+        Args:
+            ocr_text: Raw text from OCR extraction
+            max_tokens: Token budget; defaults to MAX_INPUT_TOKENS
+
+        Returns:
+            The text unchanged if it fits, otherwise its leading portion
+        """
+        max_chars = (max_tokens or self.MAX_INPUT_TOKENS) * CHARS_PER_TOKEN
+        if len(ocr_text) <= max_chars:
+            return ocr_text
+        logger.warning(
+            "Truncating OCR text to the LLM input budget",
+            provider=self.provider_name,
+            text_length=len(ocr_text),
+            max_chars=max_chars,
+        )
+        return ocr_text[:max_chars]
+
+    @staticmethod
+    def _normalize_confidences(raw_confidences: dict) -> tuple[dict[str, float], float]:
+        """Normalize confidence values to floats clamped to [0.0, 1.0].
+
+        The LLM may return nested dicts ({"confidence": ...} or {"score": ...})
+        or non-numeric values; the former are unwrapped and the latter skipped.
+        Values are summed in the same pass so callers can take the mean
+        without a second walk.
+
+        Args:
+            raw_confidences: Raw confidence dict from LLM
+
+        Returns:
+            Tuple of (flat dict with float confidence values only, sum of values)
+        """
+        normalized = {}
+        total = 0.0
+        for key, value in raw_confidences.items():
+            try:
+                confidence = float(value)
+            except (TypeError, ValueError):
+                if not isinstance(value, dict):
+                    continue
+                nested = value.get("confidence")
+                if nested is None:
+                    nested = value.get("score")
+                try:
+                    confidence = float(nested)
+                except (TypeError, ValueError):
+                    continue
+
+            # Clamp to valid range; NaN fails both comparisons and maps to 0.0
+            if confidence > 1.0:
+                confidence = 1.0
+            elif not confidence >= 0.0:
+                confidence = 0.0
+            normalized[key] = confidence
+            total += confidence
+        return normalized, total
+
     @property
     @abstractmethod
     def provider_name(self) -> str:
@@ -84,6 +225,245 @@ class BaseLLM(ABC):
         pass
 
 
+class StructuredLLMBase(BaseLLM):
+    """Shared JSON extraction workflow for prompt-in, JSON-out providers.
+
+    Prompt assembly, caching, rate limiting, JSON decoding, batching and
+    confidence scoring live here. Subclasses set _model_name and _limiter in
+    __init__ and implement _call_model to send one prompt to their API.
+    """
+
+    # Documents sent per request by parse_many_to_json
+    BATCH_SIZE = 5
+
+    _model_name: str
+    _limiter: AsyncLeakyBucket
+
+    @abstractmethod
+    async def _call_model(self, prompt: str) -> tuple[str, dict[str, Any]]:
+        """Send one extraction prompt to the model in JSON mode.
+
+        The system prompt is EXTRACTION_SYSTEM_PROMPT.
+
+        Args:
+            prompt: User prompt
+
+        Returns:
+            Tuple of (response text, extra result metadata such as token usage)
+
+        Raises:
+            LLMError: If the response is empty
+        """
+        pass
+
+    async def parse_to_json(
+        self,
+        ocr_text: str,
+        field_hints: list[str] | None = None,
+    ) -> ParseResult:
+        """Parse OCR text into structured JSON.
+
+        Args:
+            ocr_text: Raw text from OCR extraction
+            field_hints: Optional list of expected field names
+
+        Returns:
+            ParseResult with structured data and confidences
+
+        Raises:
+            LLMError: If parsing fails
+        """
+        if not ocr_text or not ocr_text.strip():
+            raise LLMError("Empty OCR text provided", self.provider_name)
+
+        logger.info("Starting LLM parsing", text_length=len(ocr_text))
+
+        cache = get_parse_cache()
+        cache_key = None
+        if cache is not None:
+            cache_key = parse_cache_key(self.provider_name, self._model_name, ocr_text, field_hints)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                logger.info("LLM parse cache hit", provider=self.provider_name)
+                return cached
+
+        try:
+            # Generate extraction prompt
+            prompt = get_extraction_prompt(self._truncate_ocr_text(ocr_text), field_hints)
+
+            # Call the model and parse JSON response
+            response_text, extra_metadata = await self._generate(prompt)
+            result = self._build_result(self._parse_json(response_text), extra_metadata)
+
+            logger.info(
+                "LLM parsing complete",
+                field_count=len(result.data),
+                confidence=f"{result.overall_confidence:.2f}",
+            )
+
+            if cache is not None:
+                cache.put(cache_key, result)
+            return result
+
+        except LLMError:
+            raise
+        except Exception as e:
+            logger.error("LLM parsing failed", error=str(e))
+            raise LLMError(f"Failed to parse text: {e}", self.provider_name) from e
+
+    async def parse_many_to_json(
+        self,
+        ocr_texts: list[str],
+        field_hints: list[str] | None = None,
+    ) -> list[ParseResult]:
+        """Parse several OCR texts using one model request per batch.
+
+        Texts are sent BATCH_SIZE at a time. If a batch response cannot be
+        matched back to its documents, that batch is parsed one text at a time.
+        Metadata such as token usage on batched results covers the whole batch.
+
+        Args:
+            ocr_texts: Raw texts from OCR extraction, one per document
+            field_hints: Optional list of expected field names
+
+        Returns:
+            ParseResults in the same order as ocr_texts
+
+        Raises:
+            LLMError: If parsing fails
+        """
+        if any(not text or not text.strip() for text in ocr_texts):
+            raise LLMError("Empty OCR text provided", self.provider_name)
+
+        results: list[ParseResult] = []
+        for start in range(0, len(ocr_texts), self.BATCH_SIZE):
+            batch = ocr_texts[start : start + self.BATCH_SIZE]
+            logger.info("Starting batched LLM parsing", document_count=len(batch))
+
+            try:
+                # The batch shares one request, so split the input budget across it
+                budget = self.MAX_INPUT_TOKENS // len(batch)
+                prompt = get_batch_extraction_prompt(
+                    [self._truncate_ocr_text(text, budget) for text in batch], field_hints
+                )
+                response_text, extra_metadata = await self._generate(prompt)
+                documents = self._parse_json(response_text).get("documents")
+            except Exception as e:
+                logger.warning("Batched LLM parsing failed, parsing individually", error=str(e))
+                documents = None
+
+            if not isinstance(documents, list) or len(documents) != len(batch):
+                results.extend([await self.parse_to_json(text, field_hints) for text in batch])
+                continue
+
+            for text, document in zip(batch, documents, strict=True):
+                if isinstance(document, dict):
+                    results.append(self._build_result(document, extra_metadata))
+                else:
+                    results.append(await self.parse_to_json(text, field_hints))
+
+        return results
+
+    async def _generate(self, prompt: str) -> tuple[str, dict[str, Any]]:
+        """Call the model under the provider rate limit.
+
+        Args:
+            prompt: User prompt
+
+        Returns:
+            Tuple of (response text with markdown fences removed, extra metadata)
+        """
+        # Rough token estimate for the TPM budget
+        estimated_tokens = (len(EXTRACTION_SYSTEM_PROMPT) + len(prompt)) // CHARS_PER_TOKEN
+        async with self._limiter.reserve(estimated_tokens):
+            response_text, extra_metadata = await self._call_model(prompt)
+
+        # Clean response if needed (remove markdown code blocks)
+        return strip_fences(response_text), extra_metadata
+
+    def _parse_json(self, response_text: str) -> dict:
+        """Decode a JSON object from the model response.
+
+        Args:
+            response_text: Cleaned response text
+
+        Returns:
+            Decoded JSON object
+
+        Raises:
+            LLMError: If the response is not a JSON object
+        """
+        try:
+            parsed = orjson.loads(response_text)
+        except orjson.JSONDecodeError as e:
+            raise LLMError(f"Invalid JSON response: {e}", self.provider_name)
+        if not isinstance(parsed, dict):
+            raise LLMError("Expected a JSON object in response", self.provider_name)
+        return parsed
+
+    def _build_result(self, parsed_data: dict, extra_metadata: dict[str, Any]) -> ParseResult:
+        """Build a ParseResult from one extracted document.
+
+        Args:
+            parsed_data: Object with "data" and "_field_confidences" keys, or the
+                older flat shape with confidences mixed into the fields
+            extra_metadata: Metadata from the request that produced the document
+
+        Returns:
+            ParseResult with normalized confidences
+        """
+        # Fields and confidences arrive as separate top-level keys; fall back to
+        # popping confidences out of a flat object for older-style responses
+        data = parsed_data.get("data")
+        if isinstance(data, dict):
+            raw_confidences = parsed_data.get("_field_confidences") or _EMPTY_CONFIDENCES
+        else:
+            data = parsed_data
+            raw_confidences = data.pop("_field_confidences", _EMPTY_CONFIDENCES)
+        field_confidences, confidence_total = self._normalize_confidences(raw_confidences)
+
+        # Calculate overall confidence
+        if field_confidences:
+            overall_confidence = confidence_total / len(field_confidences)
+        else:
+            # Estimate confidence based on data quality
+            overall_confidence = self._estimate_confidence(data)
+
+        return ParseResult(
+            data=data,
+            field_confidences=field_confidences,
+            overall_confidence=overall_confidence,
+            metadata={
+                "model": self._model_name,
+                "provider": self.provider_name,
+                **extra_metadata,
+            },
+        )
+
+    def _estimate_confidence(self, data: dict) -> float:
+        """Estimate confidence when not provided by model.
+
+        Args:
+            data: Parsed data dictionary
+
+        Returns:
+            Estimated confidence between 0.0 and 1.0
+        """
+        if not data:
+            return 0.2
+
+        # Count non-null values
+        non_null_count = sum(1 for v in data.values() if v is not None)
+        total_count = len(data)
+
+        if total_count == 0:
+            return 0.3
+
+        # Base confidence on data completeness
+        completeness = non_null_count / total_count
+        return min(0.5 + (completeness * 0.4), 0.95)
+
+
 class LLMError(Exception):
     """Exception raised when LLM parsing fails."""
 
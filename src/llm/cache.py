@@ -0,0 +1,51 @@
+"""Cache of LLM parse results keyed by prompt content."""
+
+from functools import lru_cache
+
+import orjson
+
+from src.config import get_settings
+from src.llm.prompts import PROMPT_VERSION
+from src.utils.cache import LRUCache, content_key
+
+
+@lru_cache(maxsize=1)
+def get_parse_cache() -> LRUCache | None:
+    """Get the shared parse result cache.
+
+    Returns:
+        LRUCache instance, or None if caching is disabled in settings
+    """
+    settings = get_settings()
+    if not settings.llm_cache_enabled:
+        return None
+    return LRUCache(maxsize=settings.llm_cache_size)
+
+
+def parse_cache_key(
+    provider: str,
+    model: str,
+    ocr_text: str,
+    field_hints: list[str] | None,
+) -> str:
+    """Build the cache key for a parse request.
+
+    The prompt version is part of the key, so editing the prompts
+    invalidates every existing entry.
+
+    Args:
+        provider: LLM provider name
+        model: Model identifier
+        ocr_text: OCR text being parsed
+        field_hints: Optional field name hints
+
+    Returns:
+        Cache key
+    """
+    return content_key(
+        provider,
+        model,
+        PROMPT_VERSION,
+        ocr_text,
+        orjson.dumps(field_hints or []),
+    )
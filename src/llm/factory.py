@@ -1,14 +1,28 @@
 """Factory for creating LLM provider instances."""
 
-from src.config import LLMProvider, get_settings
+from collections.abc import Callable
+from functools import lru_cache
+
+from src.config import LLMProvider, Settings, get_settings
 from src.llm.base import BaseLLM
 from src.llm.gemini_llm import GeminiLLM
 from src.llm.openai_llm import OpenAILLM
 
+_PROVIDER_BY_STR: dict[str, LLMProvider] = {p.value.lower(): p for p in LLMProvider}
+
+_LLM_FACTORIES: dict[LLMProvider, Callable[[Settings], BaseLLM]] = {
+    LLMProvider.GEMINI: lambda settings: GeminiLLM(api_key=settings.gemini_api_key),
+    LLMProvider.OPENAI: lambda settings: OpenAILLM(api_key=settings.openai_api_key),
+}
 
+
+@lru_cache(maxsize=4)
 def create_llm_provider(provider: LLMProvider | str) -> BaseLLM:
     """Create an LLM provider instance based on the provider type.
 
+    Providers hold no per-request state, so one instance per provider is
+    built and shared by all callers.
+
     Args:
         provider: LLM provider type (enum or string)
 
@@ -26,14 +40,15 @@ def create_llm_provider(provider: LLMProvider | str) -> BaseLLM:
 
     # Convert string to enum if needed
     if isinstance(provider, str):
-        provider = LLMProvider(provider.lower())
+        resolved = _PROVIDER_BY_STR.get(provider.lower())
+        if resolved is None:
+            raise ValueError(f"Unknown LLM provider: {provider}")
+        provider = resolved
 
     # Validate the provider has required configuration
     settings.validate_llm_provider(provider)
 
-    if provider == LLMProvider.GEMINI:
-        return GeminiLLM(api_key=settings.gemini_api_key)
-    elif provider == LLMProvider.OPENAI:
-        return OpenAILLM(api_key=settings.openai_api_key)
-    else:
+    factory = _LLM_FACTORIES.get(provider)
+    if factory is None:
         raise ValueError(f"Unknown LLM provider: {provider}")
+    return factory(settings)
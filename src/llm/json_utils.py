@@ -0,0 +1,19 @@
+"""Helpers for decoding JSON returned by LLMs."""
+
+import re
+
+# Optional opening ```/```json fence and optional closing ``` around the payload
+_FENCE_RE = re.compile(r"\A\s*(?:```(?:json)?)?(.*?)(?:```)?\s*\Z", re.DOTALL)
+
+
+def strip_fences(text: str) -> str:
+    """Remove markdown code fences that models sometimes wrap JSON in.
+
+    Args:
+        text: Raw response text
+
+    Returns:
+        Response text without surrounding fences or whitespace
+    """
+    match = _FENCE_RE.match(text)
+    return (match.group(1) if match else text).strip()
@@ -1,5 +1,10 @@
 """Prompt templates for LLM parsing."""
 
+from functools import lru_cache
+
+# Bump whenever the extraction prompts change so cached parse results are not reused
+PROMPT_VERSION = "v2"
+
 # System prompt for structured medical form extraction
 EXTRACTION_SYSTEM_PROMPT = """You are a medical document processing assistant. Your task is to extract structured data from OCR text of medical forms.
 
@@ -22,8 +27,48 @@ FIELD CATEGORIES:
 - Narratives: detailed descriptions, notes
 
 OUTPUT FORMAT:
-Return a valid JSON object with all extracted fields. Use snake_case for field names.
-Include a "_field_confidences" object with confidence scores (0.0-1.0) for each field."""
+Return a valid JSON object with exactly two top-level keys:
+- "data": an object with all extracted fields. Use snake_case for field names.
+- "_field_confidences": an object with confidence scores (0.0-1.0) for each field in "data"."""
+
+
+# Closing instructions that follow the OCR text in get_extraction_prompt
+_EXTRACTION_PROMPT_SUFFIX = "\n".join(
+    [
+        "---",
+        "",
+        'Return a JSON object of the form {"data": {...}, "_field_confidences": {...}}.',
+        "Use null for fields that cannot be determined.",
+    ]
+)
+
+
+def _hint_lines(field_hints: tuple[str, ...] | None) -> list[str]:
+    """Return the prompt lines listing expected field names, if any."""
+    if not field_hints:
+        return []
+    return ["Expected fields to look for:", ", ".join(field_hints), ""]
+
+
+@lru_cache(maxsize=16)
+def _extraction_prompt_prefix(field_hints: tuple[str, ...] | None) -> str:
+    """Build everything in the extraction prompt before the OCR text.
+
+    Args:
+        field_hints: Expected field names as a hashable tuple, or None
+
+    Returns:
+        Prompt prefix ending with the opening OCR text delimiter
+    """
+    return "\n".join(
+        [
+            "Extract structured data from the following OCR text of a medical form.",
+            "",
+            *_hint_lines(field_hints),
+            "OCR TEXT:",
+            "---",
+        ]
+    )
 
 
 def get_extraction_prompt(ocr_text: str, field_hints: list[str] | None = None) -> str:
@@ -33,31 +78,44 @@ def get_extraction_prompt(ocr_text: str, field_hints: list[str] | None = None) -
         ocr_text: Raw OCR text to parse
         field_hints: Optional list of expected field names
 
+    Returns:
+        Formatted prompt string
+    """
+    prefix = _extraction_prompt_prefix(tuple(field_hints) if field_hints else None)
+    return f"{prefix}\n{ocr_text}\n{_EXTRACTION_PROMPT_SUFFIX}"
+
+
+def get_batch_extraction_prompt(
+    ocr_texts: list[str],
+    field_hints: list[str] | None = None,
+) -> str:
+    """Generate a prompt that extracts several documents in one request.
+
+    Args:
+        ocr_texts: Raw OCR texts to parse, one per document
+        field_hints: Optional list of expected field names
+
     Returns:
         Formatted prompt string
     """
     prompt_parts = [
-        "Extract structured data from the following OCR text of a medical form.",
+        f"Extract structured data from each of the following {len(ocr_texts)} OCR texts "
+        "of medical forms. Treat every document independently.",
         "",
+        *_hint_lines(tuple(field_hints) if field_hints else None),
     ]
 
-    if field_hints:
-        prompt_parts.extend(
-            [
-                "Expected fields to look for:",
-                ", ".join(field_hints),
-                "",
-            ]
-        )
+    for index, ocr_text in enumerate(ocr_texts, start=1):
+        prompt_parts.extend([f"--- DOC {index} ---", ocr_text, ""])
 
     prompt_parts.extend(
         [
-            "OCR TEXT:",
-            "---",
-            ocr_text,
-            "---",
+            "--- END OF DOCUMENTS ---",
             "",
-            "Return a JSON object with all extracted fields and a _field_confidences object.",
+            'Return a JSON object of the form {"documents": [...]} containing exactly '
+            f"{len(ocr_texts)} objects in document order.",
+            'Each object has the form {"data": {...}, "_field_confidences": {...}} for that '
+            "document.",
             "Use null for fields that cannot be determined.",
         ]
     )
@@ -158,6 +216,7 @@ The position should represent where the HANDWRITTEN/FILLED VALUE appears, not th
 This will be used to overlay typed text at the same locations on a blank form."""
 
 
+@lru_cache(maxsize=32)
 def get_position_extraction_prompt(image_width: int, image_height: int) -> str:
     """Generate prompt for position-aware extraction from images.
 
@@ -0,0 +1,86 @@
+"""Client-side rate limiting for LLM provider requests."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from time import monotonic
+
+
+class AsyncLeakyBucket:
+    """Limit requests and tokens per minute for one provider.
+
+    Both budgets refill continuously. A request waits until one request
+    slot and its estimated tokens are available; waiters are served in
+    arrival order. A limit of 0 disables that budget.
+
+    Usage:
+        limiter = AsyncLeakyBucket(rpm=60, tpm=100_000)
+        async with limiter.reserve(estimated_tokens=len(prompt) // 4):
+            response = await client.call(prompt)
+    """
+
+    def __init__(self, rpm: int, tpm: int):
+        """Initialize the limiter with full budgets.
+
+        Args:
+            rpm: Maximum requests per minute (0 for unlimited)
+            tpm: Maximum tokens per minute (0 for unlimited)
+        """
+        self._rpm = rpm
+        self._tpm = tpm
+        self._available_requests = float(rpm)
+        self._available_tokens = float(tpm)
+        self._updated_at = monotonic()
+        self._lock = asyncio.Lock()
+
+    @asynccontextmanager
+    async def reserve(self, estimated_tokens: int = 0) -> AsyncIterator[None]:
+        """Wait for capacity, then run the wrapped request.
+
+        Args:
+            estimated_tokens: Estimated tokens the request will consume
+        """
+        await self._acquire(estimated_tokens)
+        yield
+
+    async def _acquire(self, estimated_tokens: int) -> None:
+        """Block until the request fits in both budgets, then consume them."""
+        if not self._rpm and not self._tpm:
+            return
+
+        # A single request larger than the whole budget would wait forever
+        tokens = min(estimated_tokens, self._tpm) if self._tpm else 0
+
+        async with self._lock:
+            while True:
+                self._refill()
+                missing_requests = 1 - self._available_requests if self._rpm else 0.0
+                missing_tokens = tokens - self._available_tokens if self._tpm else 0.0
+                if missing_requests <= 0 and missing_tokens <= 0:
+                    break
+
+                wait_seconds = 0.0
+                if missing_requests > 0:
+                    wait_seconds = missing_requests * 60 / self._rpm
+                if missing_tokens > 0:
+                    wait_seconds = max(wait_seconds, missing_tokens * 60 / self._tpm)
+                await asyncio.sleep(wait_seconds)
+
+            if self._rpm:
+                self._available_requests -= 1
+            if self._tpm:
+                self._available_tokens -= tokens
+
+    def _refill(self) -> None:
+        """Add the budget accrued since the last refill."""
+        now = monotonic()
+        elapsed_minutes = (now - self._updated_at) / 60
+        self._updated_at = now
+        if self._rpm:
+            self._available_requests = min(
+                self._rpm, self._available_requests + elapsed_minutes * self._rpm
+            )
+        if self._tpm:
+            self._available_tokens = min(
+                self._tpm, self._available_tokens + elapsed_minutes * self._tpm
+            )
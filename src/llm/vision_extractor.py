@@ -4,22 +4,28 @@ Uses Mistral Vision (pixtral-12b) to extract field values and their
 positions from document images for text overlay on regular PDFs.
 """
 
-import base64
-import json
-from dataclasses import dataclass
+import asyncio
 import io
+from dataclasses import dataclass
 
-from mistralai import Mistral
+import orjson
 from PIL import Image
 
 from src.config import get_settings
+from src.llm.json_utils import strip_fences
 from src.llm.prompts import POSITION_EXTRACTION_SYSTEM_PROMPT, get_position_extraction_prompt
+from src.utils.clients import get_mistral_client
+from src.utils.encoding import to_data_url
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Overlay output page size (US Letter) in PDF points
+PDF_WIDTH_POINTS = 612
+PDF_HEIGHT_POINTS = 792
+
 
-@dataclass
+@dataclass(slots=True)
 class FieldWithPosition:
     """Extracted field with position information."""
 
@@ -33,7 +39,7 @@ class FieldWithPosition:
     page: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class PositionExtractionResult:
     """Result from position-aware extraction."""
 
@@ -59,7 +65,7 @@ class VisionPositionExtractor:
         if not self._api_key:
             raise ValueError("Mistral API key is required for vision extraction")
 
-        self._client = Mistral(api_key=self._api_key)
+        self._client = get_mistral_client(self._api_key)
         self._model = "pixtral-12b-2409"
         logger.info("Initialized Mistral vision position extractor")
 
@@ -78,90 +84,111 @@ class VisionPositionExtractor:
         if not images:
             return PositionExtractionResult(fields=[], page_dimensions=[])
 
-        all_fields: list[FieldWithPosition] = []
-        page_dimensions: list[dict] = []
+        settings = get_settings()
+        semaphore = asyncio.Semaphore(max(1, settings.vision_concurrency))
 
-        for page_idx, image_bytes in enumerate(images):
-            logger.debug(f"Extracting positions from page {page_idx + 1}")
-
-            # Get image dimensions
-            img = Image.open(io.BytesIO(image_bytes))
-            width, height = img.size
-            page_dimensions.append({"page": page_idx, "width": width, "height": height})
-
-            # Create prompt
-            prompt = get_position_extraction_prompt(width, height)
-
-            # Detect image type for MIME
-            img_format = img.format or "PNG"
-            mime_type = f"image/{img_format.lower()}"
-            if mime_type == "image/jpg":
-                mime_type = "image/jpeg"
-
-            # Create base64 data URL
-            image_b64 = base64.b64encode(image_bytes).decode("utf-8")
-            image_url = f"data:{mime_type};base64,{image_b64}"
-
-            try:
-                # Call Mistral Vision
-                response = await self._client.chat.complete_async(
-                    model=self._model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": POSITION_EXTRACTION_SYSTEM_PROMPT,
-                        },
-                        {
-                            "role": "user",
-                            "content": [
-                                {"type": "image_url", "image_url": image_url},
-                                {"type": "text", "text": prompt},
-                            ],
-                        },
-                    ],
-                    response_format={"type": "json_object"},
-                    temperature=0.1,
-                    max_tokens=8192,
-                )
+        async def guarded(page_idx: int, image_bytes: bytes):
+            async with semaphore:
+                return await self._extract_page(page_idx, image_bytes)
 
-                # Parse response
-                response_text = response.choices[0].message.content if response.choices else "{}"
-                response_text = self._clean_json(response_text or "{}")
-
-                data = json.loads(response_text)
-                fields_data = data.get("fields", [])
-
-                for field in fields_data:
-                    pos = field.get("position", {})
-                    all_fields.append(
-                        FieldWithPosition(
-                            name=field.get("name", "unknown"),
-                            value=field.get("value"),
-                            x_percent=pos.get("x", 0),
-                            y_percent=pos.get("y", 0),
-                            width_percent=pos.get("width", 20),
-                            height_percent=pos.get("height", 3),
-                            confidence=field.get("confidence", 0.8),
-                            page=page_idx,
-                        )
-                    )
+        # One vision call per page, bounded by vision_concurrency; gather returns
+        # results in page order, so page_dimensions[i] describes page i
+        results = await asyncio.gather(
+            *(guarded(page_idx, image_bytes) for page_idx, image_bytes in enumerate(images))
+        )
 
-            except Exception as e:
-                logger.error(f"Failed to extract positions from page {page_idx}: {e}")
+        all_fields: list[FieldWithPosition] = []
+        page_dimensions: list[dict] = []
+        for dimensions, fields in results:
+            page_dimensions.append(dimensions)
+            all_fields.extend(fields)
 
         logger.info(f"Extracted {len(all_fields)} fields with positions")
         return PositionExtractionResult(fields=all_fields, page_dimensions=page_dimensions)
 
-    def _clean_json(self, text: str) -> str:
-        """Clean JSON response of markdown formatting."""
-        text = text.strip()
-        if text.startswith("```json"):
-            text = text[7:]
-        elif text.startswith("```"):
-            text = text[3:]
-        if text.endswith("```"):
-            text = text[:-3]
-        return text.strip()
+    async def _extract_page(
+        self,
+        page_idx: int,
+        image_bytes: bytes,
+    ) -> tuple[dict, list[FieldWithPosition]]:
+        """Extract fields with positions from a single page image.
+
+        Args:
+            page_idx: Zero-based page index
+            image_bytes: Page image bytes
+
+        Returns:
+            Tuple of (page dimensions dict, fields found on the page). A failed
+            vision call is logged and yields no fields for the page.
+        """
+        logger.debug(f"Extracting positions from page {page_idx + 1}")
+
+        # Get image dimensions (Image.open only parses the header; pixels stay undecoded)
+        img = Image.open(io.BytesIO(image_bytes))
+        width, height = img.size
+        dimensions = {"page": page_idx, "width": width, "height": height}
+
+        # Create prompt
+        prompt = get_position_extraction_prompt(width, height)
+
+        # Detect image type for MIME
+        img_format = img.format or "PNG"
+        mime_type = f"image/{img_format.lower()}"
+        if mime_type == "image/jpg":
+            mime_type = "image/jpeg"
+
+        # Create base64 data URL
+        image_url = to_data_url(image_bytes, mime_type)
+
+        fields: list[FieldWithPosition] = []
+        try:
+            # Call Mistral Vision
+            response = await self._client.chat.complete_async(
+                model=self._model,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": POSITION_EXTRACTION_SYSTEM_PROMPT,
+                    },
+                    {
+                        "role": "user",
+                        "content": [
+                            {"type": "image_url", "image_url": image_url},
+                            {"type": "text", "text": prompt},
+                        ],
+                    },
+                ],
+                response_format={"type": "json_object"},
+                temperature=0.1,
+                max_tokens=8192,
+            )
+
+            # Parse response
+            response_text = response.choices[0].message.content if response.choices else "{}"
+            response_text = strip_fences(response_text or "{}")
+
+            data = orjson.loads(response_text)
+            fields_data = data.get("fields", [])
+
+            for field in fields_data:
+                pos = field.get("position", {})
+                fields.append(
+                    FieldWithPosition(
+                        name=field.get("name", "unknown"),
+                        value=field.get("value"),
+                        x_percent=pos.get("x", 0),
+                        y_percent=pos.get("y", 0),
+                        width_percent=pos.get("width", 20),
+                        height_percent=pos.get("height", 3),
+                        confidence=field.get("confidence", 0.8),
+                        page=page_idx,
+                    )
+                )
+
+        except Exception as e:
+            logger.error(f"Failed to extract positions from page {page_idx}: {e}")
+
+        return dimensions, fields
 
 
 def convert_positions_to_points(
@@ -180,32 +207,21 @@ def convert_positions_to_points(
     Returns:
         List of field position dicts with x, y in points
     """
-    result = []
-
-    for field in fields:
-        if field.value is None:
-            continue
-
-        # Convert percentage to points (assuming standard letter size output)
-        pdf_width = 612  # Standard letter width in points
-        pdf_height = 792  # Standard letter height in points
-
-        x_points = (field.x_percent / 100) * pdf_width
-        y_points = (field.y_percent / 100) * pdf_height
-        width_points = (field.width_percent / 100) * pdf_width
-        height_points = (field.height_percent / 100) * pdf_height
-
-        result.append(
-            {
-                "name": field.name,
-                "value": field.value,
-                "x": x_points,
-                "y": y_points,
-                "width": width_points,
-                "height": height_points,
-                "page": field.page,
-                "font_size": 10,
-            }
-        )
-
-    return result
+    # Convert percentage to points (assuming standard letter size output)
+    x_scale = PDF_WIDTH_POINTS / 100
+    y_scale = PDF_HEIGHT_POINTS / 100
+
+    return [
+        {
+            "name": field.name,
+            "value": field.value,
+            "x": field.x_percent * x_scale,
+            "y": field.y_percent * y_scale,
+            "width": field.width_percent * x_scale,
+            "height": field.height_percent * y_scale,
+            "page": field.page,
+            "font_size": 10,
+        }
+        for field in fields
+        if field.value is not None
+    ]
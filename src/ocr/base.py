@@ -1,11 +1,18 @@
 """Base OCR interface - Abstract class for all OCR providers."""
 
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any
 
+# Labels that suggest structured form text was read ("Name:", "DATE:", ...)
+FORM_MARKER_RE = re.compile(r"(?:name|date|address|phone):", re.IGNORECASE)
 
-@dataclass
+# Separator placed between pages when combining per-page text
+PAGE_SEPARATOR = "\n\n--- Page Break ---\n\n"
+
+
+@dataclass(slots=True)
 class OCRResult:
     """Result from OCR processing.
 
@@ -53,6 +60,10 @@ class BaseOCR(ABC):
     async def extract_text(self, images: list[bytes]) -> OCRResult:
         """Extract text from images.
 
+        Pages are independent, so implementations may send them to the
+        provider concurrently (bounded by settings.ocr_concurrency), but
+        pages and page_confidences in the result must follow input order.
+
         Args:
             images: List of image bytes (one per page/image)
                    Supported formats: JPEG, PNG, HEIC, PDF pages as images
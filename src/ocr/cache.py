@@ -0,0 +1,34 @@
+"""Cache of OCR results keyed by input content."""
+
+from functools import lru_cache
+
+from src.config import get_settings
+from src.utils.cache import LRUCache, content_key
+
+
+@lru_cache(maxsize=1)
+def get_ocr_cache() -> LRUCache | None:
+    """Get the shared OCR result cache.
+
+    Returns:
+        LRUCache instance, or None if caching is disabled in settings
+    """
+    settings = get_settings()
+    if not settings.ocr_cache_enabled:
+        return None
+    return LRUCache(maxsize=settings.ocr_cache_size)
+
+
+def ocr_cache_key(provider: str, model: str, content: bytes, mode: str = "") -> str:
+    """Build the cache key for an OCR request.
+
+    Args:
+        provider: OCR provider name
+        model: Model identifier
+        content: Image or document bytes sent to the provider
+        mode: Optional request variant, for providers with more than one call shape
+
+    Returns:
+        Cache key
+    """
+    return content_key(provider, model, mode, content)
@@ -1,15 +1,35 @@
 """Factory for creating OCR provider instances."""
 
-from src.config import OCRProvider, get_settings
+from collections.abc import Callable
+from functools import lru_cache
+
+from src.config import OCRProvider, Settings, get_settings
 from src.ocr.base import BaseOCR
 from src.ocr.gemini_ocr import GeminiOCR
 from src.ocr.google_docai_stub import GoogleDocAIPlaceholder
 from src.ocr.mistral_ocr import MistralOCR
 
+_PROVIDER_BY_STR: dict[str, OCRProvider] = {p.value.lower(): p for p in OCRProvider}
+
+_OCR_FACTORIES: dict[OCRProvider, Callable[[Settings], BaseOCR]] = {
+    OCRProvider.MISTRAL: lambda settings: MistralOCR(api_key=settings.mistral_api_key),
+    OCRProvider.GEMINI: lambda settings: GeminiOCR(api_key=settings.gemini_api_key),
+    OCRProvider.GOOGLE_DOCAI: lambda settings: GoogleDocAIPlaceholder(
+        project_id=settings.google_docai_project_id,
+        location=settings.google_docai_location,
+        processor_id=settings.google_docai_processor_id,
+    ),
+}
 
+
+@lru_cache(maxsize=4)
 def create_ocr_provider(provider: OCRProvider | str) -> BaseOCR:
     """Create an OCR provider instance based on the provider type.
 
+    Providers hold no per-request state, so one instance per provider is
+    built and shared by all callers. Call create_ocr_provider.cache_clear()
+    after changing settings.
+
     Args:
         provider: OCR provider type (enum or string)
 
@@ -27,20 +47,15 @@ def create_ocr_provider(provider: OCRProvider | str) -> BaseOCR:
 
     # Convert string to enum if needed
     if isinstance(provider, str):
-        provider = OCRProvider(provider.lower())
+        resolved = _PROVIDER_BY_STR.get(provider.lower())
+        if resolved is None:
+            raise ValueError(f"Unknown OCR provider: {provider}")
+        provider = resolved
 
     # Validate the provider has required configuration
     settings.validate_ocr_provider(provider)
 
-    if provider == OCRProvider.MISTRAL:
-        return MistralOCR(api_key=settings.mistral_api_key)
-    elif provider == OCRProvider.GEMINI:
-        return GeminiOCR(api_key=settings.gemini_api_key)
-    elif provider == OCRProvider.GOOGLE_DOCAI:
-        return GoogleDocAIPlaceholder(
-            project_id=settings.google_docai_project_id,
-            location=settings.google_docai_location,
-            processor_id=settings.google_docai_processor_id,
-        )
-    else:
+    factory = _OCR_FACTORIES.get(provider)
+    if factory is None:
         raise ValueError(f"Unknown OCR provider: {provider}")
+    return factory(settings)
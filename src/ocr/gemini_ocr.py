@@ -1,16 +1,39 @@
 """Gemini Vision API OCR implementation."""
 
-import base64
+import asyncio
 
-import google.generativeai as genai
 from google.generativeai.types import GenerationConfig
 
 from src.config import get_settings
-from src.ocr.base import BaseOCR, OCRError, OCRResult
+from src.ocr.base import FORM_MARKER_RE, PAGE_SEPARATOR, BaseOCR, OCRError, OCRResult
+from src.ocr.cache import get_ocr_cache, ocr_cache_key
+from src.utils.clients import get_gemini_model
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+_MODEL_NAME = "gemini-2.0-flash"
+
+_PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
+# ISO BMFF "ftyp" box with the brands HEIC/HEIF images are written with
+_HEIC_BRANDS = frozenset({b"ftypheic", b"ftypheix", b"ftypmif1", b"ftypmsf1"})
+
+
+def _safety_blocked(response) -> bool:
+    """Return whether any safety rating on the first candidate blocked content.
+
+    Args:
+        response: Raw Gemini API response
+
+    Returns:
+        True if the response was at least partly filtered
+    """
+    candidates = getattr(response, "candidates", None)
+    if not candidates:
+        return False
+    safety_ratings = getattr(candidates[0], "safety_ratings", None) or ()
+    return any(getattr(rating, "blocked", False) for rating in safety_ratings)
+
 
 class GeminiOCR(BaseOCR):
     """OCR implementation using Gemini Vision API.
@@ -23,7 +46,7 @@ class GeminiOCR(BaseOCR):
     PHI Safety:
         - Does not log extracted text
         - API calls use HTTPS
-        - No local caching of results
+        - Results are only cached in process memory, and only when enabled
     """
 
     def __init__(self, api_key: str | None = None):
@@ -37,8 +60,7 @@ class GeminiOCR(BaseOCR):
         if not self._api_key:
             raise ValueError("Gemini API key is required")
 
-        genai.configure(api_key=self._api_key)
-        self._model = genai.GenerativeModel("gemini-2.0-flash")
+        self._model = get_gemini_model(self._api_key, _MODEL_NAME)
         logger.info("Initialized Gemini OCR client")
 
     @property
@@ -64,48 +86,38 @@ class GeminiOCR(BaseOCR):
         logger.info("Starting OCR extraction", page_count=len(images))
 
         try:
+            semaphore = asyncio.Semaphore(max(1, get_settings().ocr_concurrency))
+
+            async def process_bounded(idx: int, image_bytes: bytes) -> tuple[str, float]:
+                async with semaphore:
+                    return await self._process_page(idx, image_bytes, len(images))
+
+            # Collect page failures instead of raising the first one, so a bad page
+            # is blanked below rather than sinking the whole document
+            results = await asyncio.gather(
+                *(process_bounded(idx, image_bytes) for idx, image_bytes in enumerate(images)),
+                return_exceptions=True,
+            )
+
+            failures = [result for result in results if isinstance(result, BaseException)]
+            if len(failures) == len(results):
+                raise failures[0]
+
             pages_text: list[str] = []
             page_confidences: list[float] = []
-
-            for idx, image_bytes in enumerate(images):
-                logger.debug(f"Processing page {idx + 1}/{len(images)}")
-
-                # Detect image type
-                mime_type = self._detect_mime_type(image_bytes)
-
-                # Create image part for Gemini
-                image_part = {
-                    "mime_type": mime_type,
-                    "data": base64.b64encode(image_bytes).decode("utf-8"),
-                }
-
-                # Call Gemini Vision
-                response = await self._model.generate_content_async(
-                    [
-                        image_part,
-                        (
-                            "Extract all text from this document image. "
-                            "Include all handwritten and printed text. "
-                            "Preserve the document structure and formatting as much as possible. "
-                            "Return only the extracted text, no additional commentary or explanation."
-                        ),
-                    ],
-                    generation_config=GenerationConfig(
-                        temperature=0.1,  # Low temperature for accuracy
-                        max_output_tokens=8192,
-                    ),
-                )
-
-                # Extract text from response
-                page_text = response.text if response.text else ""
-                pages_text.append(page_text)
-
-                # Estimate confidence based on response
-                confidence = self._estimate_confidence(page_text, response)
-                page_confidences.append(confidence)
+            for idx, result in enumerate(results):
+                if isinstance(result, BaseException):
+                    # A failed page contributes no text rather than sinking the document
+                    logger.warning("OCR page failed", page=idx + 1, error=str(result))
+                    pages_text.append("")
+                    page_confidences.append(0.0)
+                else:
+                    page_text, confidence = result
+                    pages_text.append(page_text)
+                    page_confidences.append(confidence)
 
             # Combine all pages
-            combined_text = "\n\n--- Page Break ---\n\n".join(pages_text)
+            combined_text = PAGE_SEPARATOR.join(pages_text)
             overall_confidence = (
                 sum(page_confidences) / len(page_confidences) if page_confidences else 0.0
             )
@@ -121,13 +133,73 @@ class GeminiOCR(BaseOCR):
                 pages=pages_text,
                 confidence=overall_confidence,
                 page_confidences=page_confidences,
-                metadata={"model": "gemini-2.0-flash", "provider": self.provider_name},
+                metadata={"model": _MODEL_NAME, "provider": self.provider_name},
             )
 
         except Exception as e:
             logger.error("OCR extraction failed", error=str(e))
             raise OCRError(f"Failed to extract text: {e}", self.provider_name) from e
 
+    async def _process_page(
+        self,
+        idx: int,
+        image_bytes: bytes,
+        page_count: int,
+    ) -> tuple[str, float]:
+        """Extract text from a single page image.
+
+        Args:
+            idx: Zero-based page index
+            image_bytes: Page image bytes
+            page_count: Total pages in the document, for logging
+
+        Returns:
+            Tuple of (page text, estimated confidence)
+        """
+        logger.debug(f"Processing page {idx + 1}/{page_count}")
+
+        cache = get_ocr_cache()
+        cache_key = None
+        if cache is not None:
+            cache_key = ocr_cache_key(self.provider_name, _MODEL_NAME, image_bytes)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"OCR cache hit for page {idx + 1}")
+                return cached
+
+        # Detect image type
+        mime_type = self._detect_mime_type(image_bytes)
+
+        # Create image part for Gemini; the SDK's Blob takes raw bytes, so there
+        # is no need to base64-encode here only for it to be decoded again
+        image_part = {"mime_type": mime_type, "data": image_bytes}
+
+        # Call Gemini Vision
+        response = await self._model.generate_content_async(
+            [
+                image_part,
+                (
+                    "Extract all text from this document image. "
+                    "Include all handwritten and printed text. "
+                    "Preserve the document structure and formatting as much as possible. "
+                    "Return only the extracted text, no additional commentary or explanation."
+                ),
+            ],
+            generation_config=GenerationConfig(
+                temperature=0.1,  # Low temperature for accuracy
+                max_output_tokens=8192,
+            ),
+        )
+
+        # Extract text from response (.text re-walks the candidates, so read it once)
+        page_text = response.text or ""
+
+        # Estimate confidence based on response
+        result = (page_text, self._estimate_confidence(page_text, _safety_blocked(response)))
+        if cache is not None:
+            cache.put(cache_key, result)
+        return result
+
     def _detect_mime_type(self, image_bytes: bytes) -> str:
         """Detect MIME type from magic bytes.
 
@@ -137,23 +209,24 @@ class GeminiOCR(BaseOCR):
         Returns:
             MIME type string
         """
-        if image_bytes[:8] == b"\x89PNG\r\n\x1a\n":
+        head = image_bytes[:12]
+        if head[:8] == _PNG_MAGIC:
             return "image/png"
-        if image_bytes[:2] == b"\xff\xd8":
+        if head[:2] == b"\xff\xd8":
             return "image/jpeg"
-        if image_bytes[:4] == b"RIFF" and image_bytes[8:12] == b"WEBP":
+        if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
             return "image/webp"
-        if image_bytes[4:12] == b"ftypheic" or image_bytes[4:12] == b"ftypmif1":
+        if head[4:12] in _HEIC_BRANDS:
             return "image/heic"
         # Default to jpeg
         return "image/jpeg"
 
-    def _estimate_confidence(self, text: str, response) -> float:
+    def _estimate_confidence(self, text: str, blocked: bool) -> float:
         """Estimate confidence score based on response quality.
 
         Args:
             text: Extracted text
-            response: Raw API response
+            blocked: Whether a safety rating blocked part of the response
 
         Returns:
             Estimated confidence between 0.0 and 1.0
@@ -169,17 +242,11 @@ class GeminiOCR(BaseOCR):
             confidence += 0.1
 
         # Boost for structured content
-        if any(marker in text.lower() for marker in ["name:", "date:", "address:", "phone:"]):
+        if FORM_MARKER_RE.search(text):
             confidence += 0.1
 
-        # Check for safety ratings - lower confidence if content was filtered
-        if hasattr(response, "candidates") and response.candidates:
-            candidate = response.candidates[0]
-            if hasattr(candidate, "safety_ratings"):
-                # If any safety rating blocked content, reduce confidence
-                for rating in candidate.safety_ratings:
-                    if hasattr(rating, "blocked") and rating.blocked:
-                        confidence -= 0.2
-                        break
+        # Lower confidence if content was filtered
+        if blocked:
+            confidence -= 0.2
 
         return min(max(confidence, 0.0), 0.95)
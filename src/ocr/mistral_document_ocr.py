@@ -8,19 +8,36 @@ This uses Mistral's `client.ocr.process()` API which:
 Reference: https://docs.mistral.ai/capabilities/document_ai/annotations
 """
 
-import base64
+import asyncio
+import copy
+import os
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from typing import Any
 
 import fitz  # PyMuPDF
-from mistralai import Mistral
+import orjson
 from pydantic import BaseModel, Field
 
 from src.config import get_settings
+from src.ocr.base import PAGE_SEPARATOR
+from src.ocr.cache import get_ocr_cache, ocr_cache_key
+from src.pdf.utils import FITZ_LOCK
+from src.utils.clients import get_mistral_client
+from src.utils.encoding import to_data_url
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+_MODEL_NAME = "mistral-ocr-latest"
+
+_EXT_TO_MIME = {
+    ".pdf": "application/pdf",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+}
+
 
 class FormField(BaseModel):
     """A single form field with its value and position."""
@@ -38,7 +55,7 @@ class FormExtractionResult(BaseModel):
     fields: list[FormField] = Field(description="List of all extracted form fields")
 
 
-@dataclass
+@dataclass(slots=True)
 class MistralOCRResult:
     """Result from Mistral OCR processing."""
 
@@ -50,6 +67,59 @@ class MistralOCRResult:
     metadata: dict[str, Any]
 
 
+def _document_mime_type(filename: str) -> str:
+    """Pick the MIME type Mistral OCR is told for an upload, from its filename.
+
+    Args:
+        filename: Original filename
+
+    Returns:
+        MIME type; unknown extensions are sent as JPEG
+    """
+    return _EXT_TO_MIME.get(os.path.splitext(filename)[1].lower(), "image/jpeg")
+
+
+def _open_pdf(content: bytes) -> tuple[fitz.Document, int]:
+    """Parse a PDF with PyMuPDF and count its pages, holding FITZ_LOCK.
+
+    Args:
+        content: PDF file bytes
+
+    Returns:
+        Tuple of (open document, page count)
+    """
+    with FITZ_LOCK:
+        doc = fitz.open(stream=content, filetype="pdf")
+        return doc, len(doc)
+
+
+def _close_pdf(doc: fitz.Document) -> None:
+    """Close a PyMuPDF document, holding FITZ_LOCK."""
+    with FITZ_LOCK:
+        doc.close()
+
+
+def _extract_page_range(doc: fitz.Document, start_page: int, end_page: int) -> bytes:
+    """Copy pages [start_page, end_page) of a PDF into a new PDF, holding FITZ_LOCK.
+
+    Args:
+        doc: Source PyMuPDF document
+        start_page: First page index to copy
+        end_page: Page index to stop before
+
+    Returns:
+        Bytes of the new, compacted PDF
+    """
+    with FITZ_LOCK:
+        chunk_doc = fitz.open()
+        try:
+            chunk_doc.insert_pdf(doc, from_page=start_page, to_page=end_page - 1)
+            # Drop unused/duplicate objects and deflate streams for a smaller upload
+            return chunk_doc.tobytes(garbage=3, deflate=True)
+        finally:
+            chunk_doc.close()
+
+
 class MistralDocumentOCR:
     """OCR implementation using Mistral's dedicated OCR API.
 
@@ -67,9 +137,46 @@ class MistralDocumentOCR:
         self._api_key = api_key or settings.mistral_api_key
         if not self._api_key:
             raise ValueError("Mistral API key is required")
-        self._client = Mistral(api_key=self._api_key)
+        self._client = get_mistral_client(self._api_key)
         logger.info("Initialized Mistral Document OCR client")
 
+    async def _cached(
+        self,
+        mode: str,
+        file_content: bytes,
+        filename: str,
+        process: Callable[[bytes, str], Awaitable[MistralOCRResult]],
+    ) -> MistralOCRResult:
+        """Serve a result from the OCR cache, or process and cache it.
+
+        Results hold mutable dicts and lists, so the cache stores and hands
+        out deep copies; callers may adjust what they get back freely.
+
+        Args:
+            mode: Request variant, kept apart in the cache key
+            file_content: Raw PDF or image bytes
+            filename: Original filename
+            process: Uncached processing method to call on a miss
+
+        Returns:
+            MistralOCRResult for the document
+        """
+        cache = get_ocr_cache()
+        if cache is None:
+            return await process(file_content, filename)
+
+        # The upload's MIME type follows the filename, so it is part of the key
+        mime_type = _document_mime_type(filename)
+        cache_key = ocr_cache_key("mistral", _MODEL_NAME, file_content, f"{mode}:{mime_type}")
+        cached = cache.get(cache_key)
+        if cached is not None:
+            logger.info("OCR cache hit", provider="mistral")
+            return copy.deepcopy(cached)
+
+        result = await process(file_content, filename)
+        cache.put(cache_key, copy.deepcopy(result))
+        return result
+
     async def process_document(
         self,
         file_content: bytes,
@@ -86,75 +193,101 @@ class MistralDocumentOCR:
         Returns:
             MistralOCRResult with extracted data and positions
         """
+        return await self._cached(
+            "annotated", file_content, filename, self._process_document_uncached
+        )
+
+    async def _process_document_uncached(
+        self,
+        file_content: bytes,
+        filename: str,
+    ) -> MistralOCRResult:
+        """Run process_document against the API, bypassing the cache."""
         logger.info("Starting Mistral OCR processing", filename=filename)
 
-        # Check if PDF and split if needed
-        if filename.lower().endswith(".pdf"):
+        # Check if PDF and split if needed; the parsed document is reused for slicing.
+        # Parsing runs in a worker thread so large PDFs don't stall the event loop.
+        if _document_mime_type(filename) == "application/pdf":
             try:
-                import fitz  # PyMuPDF
-
-                doc = fitz.open(stream=file_content, filetype="pdf")
-                page_count = len(doc)
-
-                if page_count > 8:
-                    logger.info(f"PDF has {page_count} pages, processing in chunks of 8")
-                    return await self._process_chunked_pdf(doc, filename)
-
-                doc.close()
+                doc, page_count = await asyncio.to_thread(_open_pdf, file_content)
             except Exception as e:
                 logger.warning(f"Could not check PDF page count: {e}")
+            else:
+                if page_count > 8:
+                    logger.info(f"PDF has {page_count} pages, processing in chunks of 8")
+                    # _process_chunked_pdf closes doc when it is done
+                    return await self._process_chunked_pdf(doc, page_count, filename)
+                await asyncio.to_thread(_close_pdf, doc)
 
-        # Process normally for ≤8 pages or non-PDFs
+        # Process normally for ≤8 pages or non-PDFs, sending the original bytes as-is
         return await self._process_single_document(file_content, filename)
 
-    async def _process_chunked_pdf(self, doc, filename: str) -> MistralOCRResult:
+    async def _process_chunked_pdf(self, doc, total_pages: int, filename: str) -> MistralOCRResult:
         """Process a large PDF in chunks of 8 pages.
 
         Args:
             doc: PyMuPDF document object
+            total_pages: Page count of doc
             filename: Original filename
 
         Returns:
             Combined MistralOCRResult from all chunks
         """
-        all_fields = []
-        all_extracted_data = {}
-        all_raw_text = []
-        total_pages = len(doc)
-
         # Process in chunks of 8 pages
-        for start_page in range(0, total_pages, 8):
-            end_page = min(start_page + 8, total_pages)
-            logger.info(f"Processing pages {start_page + 1}-{end_page} of {total_pages}")
-
-            # Create a new PDF with just this chunk
-            chunk_doc = fitz.open()
-            for page_num in range(start_page, end_page):
-                chunk_doc.insert_pdf(doc, from_page=page_num, to_page=page_num)
-
-            # Save chunk to bytes
-            chunk_bytes = chunk_doc.write()
-            chunk_doc.close()
-
-            # Process this chunk
+        page_ranges = [
+            (start_page, min(start_page + 8, total_pages))
+            for start_page in range(0, total_pages, 8)
+        ]
+        chunk_results: list[MistralOCRResult | None] = [None] * len(page_ranges)
+        workers = max(1, min(get_settings().ocr_concurrency, len(page_ranges)))
+
+        # Slicing runs in a worker thread while earlier chunks are at the API;
+        # the bound keeps only a few chunks' bytes in memory at once
+        queue: asyncio.Queue[tuple[int, bytes] | None] = asyncio.Queue(maxsize=workers)
+
+        async def produce_chunks() -> None:
             try:
-                chunk_result = await self._process_single_document(
-                    chunk_bytes,
-                    f"{filename}_chunk_{start_page + 1}_{end_page}.pdf",
-                )
-
-                # Adjust page numbers and combine results
-                for field in chunk_result.fields_with_positions:
-                    field["page"] = field.get("page", 0) + start_page
-                    all_fields.append(field)
+                for index, (start_page, end_page) in enumerate(page_ranges):
+                    chunk_bytes = await asyncio.to_thread(
+                        _extract_page_range, doc, start_page, end_page
+                    )
+                    await queue.put((index, chunk_bytes))
+            finally:
+                for _ in range(workers):
+                    await queue.put(None)
+
+        async def consume_chunks() -> None:
+            while (chunk := await queue.get()) is not None:
+                index, chunk_bytes = chunk
+                start_page, end_page = page_ranges[index]
+                logger.info(f"Processing pages {start_page + 1}-{end_page} of {total_pages}")
+
+                try:
+                    chunk_results[index] = await self._process_single_document(
+                        chunk_bytes,
+                        f"{filename}_chunk_{start_page + 1}_{end_page}.pdf",
+                    )
+                except Exception as e:
+                    logger.warning(f"Chunk {start_page + 1}-{end_page} failed: {e}")
 
-                all_extracted_data.update(chunk_result.extracted_data)
-                all_raw_text.append(chunk_result.raw_text)
+        try:
+            await asyncio.gather(produce_chunks(), *(consume_chunks() for _ in range(workers)))
+        finally:
+            await asyncio.to_thread(_close_pdf, doc)
 
-            except Exception as e:
-                logger.warning(f"Chunk {start_page + 1}-{end_page} failed: {e}")
+        # Combine results in page order, offsetting page numbers by chunk start
+        all_fields = []
+        all_extracted_data = {}
+        all_raw_text = []
+        for (start_page, _), chunk_result in zip(page_ranges, chunk_results, strict=True):
+            if chunk_result is None:
+                continue
+            for field in chunk_result.fields_with_positions:
+                field["page"] = field.get("page", 0) + start_page
+                all_fields.append(field)
 
-        doc.close()
+            all_extracted_data.update(chunk_result.extracted_data)
+            all_raw_text.append(chunk_result.raw_text)
 
         logger.info(
             "Chunked processing complete",
@@ -165,10 +298,10 @@ class MistralDocumentOCR:
         return MistralOCRResult(
             extracted_data=all_extracted_data,
             fields_with_positions=all_fields,
-            raw_text="\n\n--- Page Break ---\n\n".join(all_raw_text),
+            raw_text=PAGE_SEPARATOR.join(all_raw_text),
             confidence=0.9,
             page_count=total_pages,
-            metadata={"model": "mistral-ocr-latest", "provider": "mistral", "chunked": True},
+            metadata={"model": _MODEL_NAME, "provider": "mistral", "chunked": True},
         )
 
     async def _process_single_document(
@@ -178,19 +311,8 @@ class MistralDocumentOCR:
     ) -> MistralOCRResult:
         """Process a single document (max 8 pages) using Mistral OCR API."""
         try:
-            # Encode file to base64 for API
-            file_b64 = base64.b64encode(file_content).decode("utf-8")
-
-            # Determine MIME type
-            if filename.lower().endswith(".pdf"):
-                mime_type = "application/pdf"
-                data_url = f"data:{mime_type};base64,{file_b64}"
-            else:
-                # Image file
-                ext = filename.lower().rsplit(".", 1)[-1]
-                mime_map = {"jpg": "jpeg", "jpeg": "jpeg", "png": "png"}
-                img_type = mime_map.get(ext, "jpeg")
-                data_url = f"data:image/{img_type};base64,{file_b64}"
+            # Encode file as a base64 data URL for the API
+            data_url = to_data_url(file_content, _document_mime_type(filename))
 
             # Import the response format helper
             from mistralai.extra import response_format_from_pydantic_model
@@ -198,7 +320,7 @@ class MistralDocumentOCR:
             # Call Mistral OCR API with structured extraction
             logger.info("Calling Mistral OCR API...")
             response = await self._client.ocr.process_async(
-                model="mistral-ocr-latest",
+                model=_MODEL_NAME,
                 document={"type": "document_url", "document_url": data_url},
                 document_annotation_format=response_format_from_pydantic_model(
                     FormExtractionResult
@@ -208,58 +330,49 @@ class MistralDocumentOCR:
 
             logger.info("Mistral OCR API response received")
 
-            # Parse the response
-            pages = response.pages if hasattr(response, "pages") else []
+            # Parse the response (an OCRResponse model, so the fields always exist)
+            pages = response.pages or []
             page_count = len(pages)
 
             # Extract text from all pages
-            raw_text_parts = []
-            for page in pages:
-                if hasattr(page, "markdown"):
-                    raw_text_parts.append(page.markdown)
-                elif hasattr(page, "text"):
-                    raw_text_parts.append(page.text)
-
-            raw_text = "\n\n--- Page Break ---\n\n".join(raw_text_parts)
+            raw_text = PAGE_SEPARATOR.join(page.markdown or "" for page in pages)
 
             # Get structured annotation if available
             fields_with_positions = []
             extracted_data = {}
 
-            # Debug: Log document_annotation
-            if hasattr(response, "document_annotation"):
-                logger.info(f"document_annotation type: {type(response.document_annotation)}")
-                ann_str = str(response.document_annotation)[:500]
-                logger.info(f"document_annotation preview: {ann_str}")
+            annotation = response.document_annotation
 
-            if hasattr(response, "document_annotation") and response.document_annotation:
-                annotation = response.document_annotation
+            logger.debug("Document annotation received", annotation_type=type(annotation).__name__)
 
+            if annotation:
                 # Handle string annotation (JSON string)
                 if isinstance(annotation, str):
-                    import json
-
                     try:
-                        annotation = json.loads(annotation)
-                    except json.JSONDecodeError:
+                        annotation = orjson.loads(annotation)
+                    except orjson.JSONDecodeError:
                         logger.warning("Could not parse annotation as JSON")
 
                 if isinstance(annotation, dict):
                     if "fields" in annotation:
-                        for field in annotation["fields"]:
-                            fields_with_positions.append(
-                                {
-                                    "name": field.get("field_name", "unknown"),
-                                    "value": field.get("field_value"),
-                                    "x": field.get("x_percent", 0),
-                                    "y": field.get("y_percent", 0),
-                                    "width": 20,
-                                    "height": 3,
-                                    "page": field.get("page_number", 0),
-                                }
-                            )
-                            if field.get("field_value"):
-                                extracted_data[field["field_name"]] = field["field_value"]
+                        fields = annotation["fields"]
+                        fields_with_positions = [
+                            {
+                                "name": field.get("field_name", "unknown"),
+                                "value": field.get("field_value"),
+                                "x": field.get("x_percent", 0),
+                                "y": field.get("y_percent", 0),
+                                "width": 20,
+                                "height": 3,
+                                "page": field.get("page_number", 0),
+                            }
+                            for field in fields
+                        ]
+                        extracted_data = {
+                            field["field_name"]: value
+                            for field in fields
+                            if (value := field.get("field_value"))
+                        }
                     else:
                         logger.warning(f"No 'fields' key. Keys found: {list(annotation.keys())}")
                 else:
@@ -277,7 +390,7 @@ class MistralDocumentOCR:
                 raw_text=raw_text,
                 confidence=0.9,
                 page_count=page_count,
-                metadata={"model": "mistral-ocr-latest", "provider": "mistral"},
+                metadata={"model": _MODEL_NAME, "provider": "mistral"},
             )
 
         except Exception as e:
@@ -293,33 +406,30 @@ class MistralDocumentOCR:
 
         Fallback method that just extracts text without positions.
         """
+        return await self._cached(
+            "basic", file_content, filename, self._process_with_basic_ocr_uncached
+        )
+
+    async def _process_with_basic_ocr_uncached(
+        self,
+        file_content: bytes,
+        filename: str,
+    ) -> MistralOCRResult:
+        """Run process_with_basic_ocr against the API, bypassing the cache."""
         logger.info("Using basic Mistral OCR", filename=filename)
 
         try:
-            file_b64 = base64.b64encode(file_content).decode("utf-8")
-
-            if filename.lower().endswith(".pdf"):
-                data_url = f"data:application/pdf;base64,{file_b64}"
-            else:
-                ext = filename.lower().rsplit(".", 1)[-1]
-                mime_map = {"jpg": "jpeg", "jpeg": "jpeg", "png": "png"}
-                img_type = mime_map.get(ext, "jpeg")
-                data_url = f"data:image/{img_type};base64,{file_b64}"
+            data_url = to_data_url(file_content, _document_mime_type(filename))
 
             response = await self._client.ocr.process_async(
-                model="mistral-ocr-latest",
+                model=_MODEL_NAME,
                 document={"type": "document_url", "document_url": data_url},
             )
 
-            pages = response.pages if hasattr(response, "pages") else []
+            pages = response.pages or []
             page_count = len(pages)
 
-            raw_text_parts = []
-            for page in pages:
-                if hasattr(page, "markdown"):
-                    raw_text_parts.append(page.markdown)
-
-            raw_text = "\n\n--- Page Break ---\n\n".join(raw_text_parts)
+            raw_text = PAGE_SEPARATOR.join(page.markdown or "" for page in pages)
 
             logger.info("Basic OCR complete", page_count=page_count)
 
@@ -329,7 +439,7 @@ class MistralDocumentOCR:
                 raw_text=raw_text,
                 confidence=0.9,
                 page_count=page_count,
-                metadata={"model": "mistral-ocr-latest", "provider": "mistral"},
+                metadata={"model": _MODEL_NAME, "provider": "mistral"},
             )
 
         except Exception as e:
@@ -1,16 +1,19 @@
 """Mistral Document AI OCR implementation."""
 
-import base64
+import asyncio
 from typing import Any
 
-from mistralai import Mistral
-
 from src.config import get_settings
-from src.ocr.base import BaseOCR, OCRError, OCRResult
+from src.ocr.base import FORM_MARKER_RE, PAGE_SEPARATOR, BaseOCR, OCRError, OCRResult
+from src.ocr.cache import get_ocr_cache, ocr_cache_key
+from src.utils.clients import get_mistral_client
+from src.utils.encoding import to_data_url
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+_MODEL_NAME = "pixtral-12b-2409"
+
 
 class MistralOCR(BaseOCR):
     """OCR implementation using Mistral Document AI Basic OCR API.
@@ -23,7 +26,7 @@ class MistralOCR(BaseOCR):
     PHI Safety:
         - Does not log extracted text
         - API calls use HTTPS
-        - No local caching of results
+        - Results are only cached in process memory, and only when enabled
     """
 
     def __init__(self, api_key: str | None = None):
@@ -36,7 +39,7 @@ class MistralOCR(BaseOCR):
         self._api_key = api_key or settings.mistral_api_key
         if not self._api_key:
             raise ValueError("Mistral API key is required")
-        self._client = Mistral(api_key=self._api_key)
+        self._client = get_mistral_client(self._api_key)
         logger.info("Initialized Mistral OCR client")
 
     @property
@@ -62,37 +65,34 @@ class MistralOCR(BaseOCR):
         logger.info("Starting OCR extraction", page_count=len(images))
 
         try:
-            import asyncio
-
-            # Process pages sequentially with timeout for reliability
-            pages_text: list[str] = []
-            page_confidences: list[float] = []
-
-            for idx, image_bytes in enumerate(images):
-                logger.info(f"Processing page {idx + 1}/{len(images)}")
-
-                try:
-                    # Add 60-second timeout per page
-                    result = await asyncio.wait_for(
-                        self._process_single_page(idx, image_bytes), timeout=60.0
-                    )
-                    text, confidence = result
-                    pages_text.append(text)
-                    page_confidences.append(confidence)
+            semaphore = asyncio.Semaphore(max(1, get_settings().ocr_concurrency))
+
+            async def process_bounded(idx: int, image_bytes: bytes) -> tuple[str, float]:
+                async with semaphore:
+                    try:
+                        # Add 60-second timeout per page
+                        result = await asyncio.wait_for(
+                            self._process_single_page(idx, image_bytes), timeout=60.0
+                        )
+                    except asyncio.TimeoutError:
+                        logger.warning(f"Page {idx + 1} timed out after 60s")
+                        return f"[Page {idx + 1} timed out]", 0.1
+                    except Exception as e:
+                        logger.warning(f"Page {idx + 1} failed: {e}")
+                        return f"[Page {idx + 1} extraction failed]", 0.2
                     logger.info(f"Page {idx + 1} complete")
+                    return result
 
-                except asyncio.TimeoutError:
-                    logger.warning(f"Page {idx + 1} timed out after 60s")
-                    pages_text.append(f"[Page {idx + 1} timed out]")
-                    page_confidences.append(0.1)
-
-                except Exception as e:
-                    logger.warning(f"Page {idx + 1} failed: {e}")
-                    pages_text.append(f"[Page {idx + 1} extraction failed]")
-                    page_confidences.append(0.2)
+            # process_bounded turns timeouts and errors into placeholder pages, so
+            # one slow or failed page never aborts the gather
+            results = await asyncio.gather(
+                *(process_bounded(idx, image_bytes) for idx, image_bytes in enumerate(images))
+            )
+            pages_text = [text for text, _ in results]
+            page_confidences = [confidence for _, confidence in results]
 
             # Combine all pages
-            combined_text = "\n\n--- Page Break ---\n\n".join(pages_text)
+            combined_text = PAGE_SEPARATOR.join(pages_text)
             overall_confidence = (
                 sum(page_confidences) / len(page_confidences) if page_confidences else 0.0
             )
@@ -108,7 +108,7 @@ class MistralOCR(BaseOCR):
                 pages=pages_text,
                 confidence=overall_confidence,
                 page_confidences=page_confidences,
-                metadata={"model": "pixtral-12b-2409", "provider": self.provider_name},
+                metadata={"model": _MODEL_NAME, "provider": self.provider_name},
             )
 
         except Exception as e:
@@ -127,22 +127,29 @@ class MistralOCR(BaseOCR):
         """
         logger.debug(f"Processing page {idx + 1}")
 
-        # Encode image to base64
-        image_b64 = base64.b64encode(image_bytes).decode("utf-8")
+        cache = get_ocr_cache()
+        cache_key = None
+        if cache is not None:
+            cache_key = ocr_cache_key(self.provider_name, _MODEL_NAME, image_bytes)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"OCR cache hit for page {idx + 1}")
+                return cached
 
-        # Determine image type from bytes
+        # Determine image type from bytes and encode as a data URL
         image_type = self._detect_image_type(image_bytes)
+        image_url = to_data_url(image_bytes, f"image/{image_type}")
 
         # Call Mistral Document AI with vision model
         response = await self._client.chat.complete_async(
-            model="pixtral-12b-2409",
+            model=_MODEL_NAME,
             messages=[
                 {
                     "role": "user",
                     "content": [
                         {
                             "type": "image_url",
-                            "image_url": f"data:image/{image_type};base64,{image_b64}",
+                            "image_url": image_url,
                         },
                         {
                             "type": "text",
@@ -165,6 +172,8 @@ class MistralOCR(BaseOCR):
         confidence = self._estimate_confidence(page_text, response)
 
         logger.debug(f"Page {idx + 1} complete")
+        if cache is not None:
+            cache.put(cache_key, (page_text, confidence))
         return page_text, confidence
 
     def _detect_image_type(self, image_bytes: bytes) -> str:
@@ -176,11 +185,11 @@ class MistralOCR(BaseOCR):
         Returns:
             Image MIME type suffix (jpeg, png, etc.)
         """
-        if image_bytes[:8] == b"\x89PNG\r\n\x1a\n":
+        if image_bytes.startswith(b"\x89PNG\r\n\x1a\n"):
             return "png"
-        if image_bytes[:2] == b"\xff\xd8":
+        if image_bytes.startswith(b"\xff\xd8"):
             return "jpeg"
-        if image_bytes[:4] == b"RIFF" and image_bytes[8:12] == b"WEBP":
+        if image_bytes.startswith(b"RIFF") and image_bytes[8:12] == b"WEBP":
             return "webp"
         # Default to jpeg for unknown
         return "jpeg"
@@ -211,7 +220,7 @@ class MistralOCR(BaseOCR):
             confidence += 0.1
 
         # Boost for structured content (likely successful extraction)
-        if any(marker in text.lower() for marker in ["name:", "date:", "address:", "phone:"]):
+        if FORM_MARKER_RE.search(text):
             confidence += 0.1
 
         # Cap at 0.95 (we can never be 100% certain without ground truth)
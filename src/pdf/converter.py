@@ -1,10 +1,17 @@
 """PDF and image conversion utilities."""
 
 import io
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import BinaryIO
 
 import pillow_heif
+import pypdfium2 as pdfium
 from pdf2image import convert_from_bytes
 from PIL import Image
 
@@ -15,6 +22,34 @@ logger = get_logger(__name__)
 # Register HEIF opener with Pillow
 pillow_heif.register_heif_opener()
 
+# PDFs up to this many pages render in the calling thread; the process pool
+# only pays off once there are enough pages to spread across workers
+SERIAL_RENDER_MAX_PAGES = 2
+_RENDER_WORKERS = os.cpu_count() or 1
+
+# PDFium is not thread-safe; conversions may run in several threads at once
+# (see conversion_concurrency), so in-process PDFium calls take this lock
+_PDFIUM_LOCK = threading.Lock()
+
+# IHDR (bit depth, color type) pairs for 8-bit grayscale and 8-bit RGB
+_PLAIN_PNG_DEPTH_AND_COLOR = (b"\x08\x00", b"\x08\x02")
+
+# Chunks a passed-through PNG may contain. Anything else (tEXt, iTXt, zTXt,
+# eXIf, ...) can carry PHI or location data, so such files are re-encoded,
+# which drops it before the image goes to a third-party OCR provider
+_PLAIN_PNG_CHUNKS = frozenset({b"IHDR", b"IDAT", b"IEND", b"pHYs", b"gAMA", b"sRGB"})
+
+# File type by extension, used when the magic bytes are not recognized
+_EXT_TO_TYPE = {
+    ".pdf": "pdf",
+    ".jpg": "jpeg",
+    ".jpeg": "jpeg",
+    ".png": "png",
+    ".webp": "webp",
+    ".heic": "heic",
+    ".heif": "heic",
+}
+
 
 class ConversionError(Exception):
     """Exception raised when file conversion fails."""
@@ -64,7 +99,7 @@ def convert_to_images(
         if file_type == "pdf":
             return _convert_pdf(file_content, dpi)
         elif file_type in ("jpeg", "png", "webp"):
-            return _convert_standard_image(file_content)
+            return _convert_standard_image(file_content, file_type)
         elif file_type == "heic":
             return _convert_heic(file_content)
         else:
@@ -87,29 +122,21 @@ def _detect_file_type(content: bytes, extension: str) -> str:
     Returns:
         Detected file type string
     """
-    # Check magic bytes first
-    if content[:5] == b"%PDF-":
+    # Check magic bytes first, against one short header slice
+    head = content[:20]
+    if head.startswith(b"%PDF-"):
         return "pdf"
-    if content[:8] == b"\x89PNG\r\n\x1a\n":
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
         return "png"
-    if content[:2] == b"\xff\xd8":
+    if head.startswith(b"\xff\xd8"):
         return "jpeg"
-    if content[:4] == b"RIFF" and content[8:12] == b"WEBP":
+    if head.startswith(b"RIFF") and head[8:12] == b"WEBP":
         return "webp"
-    if b"ftypheic" in content[:20] or b"ftypmif1" in content[:20]:
+    if b"ftypheic" in head or b"ftypmif1" in head:
         return "heic"
 
     # Fall back to extension
-    ext_map = {
-        ".pdf": "pdf",
-        ".jpg": "jpeg",
-        ".jpeg": "jpeg",
-        ".png": "png",
-        ".webp": "webp",
-        ".heic": "heic",
-        ".heif": "heic",
-    }
-    return ext_map.get(extension, "unknown")
+    return _EXT_TO_TYPE.get(extension, "unknown")
 
 
 def _convert_pdf(content: bytes, dpi: int) -> list[bytes]:
@@ -124,45 +151,155 @@ def _convert_pdf(content: bytes, dpi: int) -> list[bytes]:
     """
     logger.debug("Converting PDF pages to images", dpi=dpi)
 
-    # Convert PDF pages to PIL Images
-    images = convert_from_bytes(content, dpi=dpi, fmt="png")
+    # Render in-process with PDFium; pdf2image shells out to Poppler and
+    # round-trips every page through a temp file
+    try:
+        with _PDFIUM_LOCK:
+            pdf = pdfium.PdfDocument(content)
+            page_count = len(pdf)
+            pdf.close()
+
+        if page_count <= SERIAL_RENDER_MAX_PAGES or _RENDER_WORKERS < 2:
+            with _PDFIUM_LOCK:
+                result = _render_pages(content, 0, page_count, dpi)
+        else:
+            # Rendering is CPU-bound and PDFium is not thread-safe, so pages
+            # fan out across worker processes that each open their own copy.
+            # One contiguous page range per worker means the PDF bytes are
+            # pickled once per worker, not once per page.
+            chunk = -(-page_count // _RENDER_WORKERS)
+            starts = range(0, page_count, chunk)
+            stops = [min(start + chunk, page_count) for start in starts]
+            render = partial(_render_pages, content, dpi=dpi)
+            result = [png for pngs in _render_pool().map(render, starts, stops) for png in pngs]
+    except Exception as e:
+        if isinstance(e, BrokenProcessPool):
+            _render_pool.cache_clear()
+        logger.warning("PDFium rendering failed, falling back to pdf2image", error=str(e))
+        result = [_to_png(img) for img in convert_from_bytes(content, dpi=dpi, fmt="png")]
 
-    logger.info("PDF conversion complete", page_count=len(images))
+    logger.info("PDF conversion complete", page_count=len(result))
+    return result
 
-    # Convert each PIL Image to bytes
-    result = []
-    for idx, img in enumerate(images):
-        buffer = io.BytesIO()
-        img.save(buffer, format="PNG")
-        result.append(buffer.getvalue())
-        logger.debug(f"Converted page {idx + 1}")
 
-    return result
+@lru_cache(maxsize=1)
+def _render_pool() -> ProcessPoolExecutor:
+    """Return the shared process pool used to render PDF pages."""
+    # spawn rather than fork: the server process runs threads, which fork can deadlock
+    return ProcessPoolExecutor(
+        max_workers=_RENDER_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
 
 
-def _convert_standard_image(content: bytes) -> list[bytes]:
+def _render_pages(content: bytes, start: int, stop: int, dpi: int) -> list[bytes]:
+    """Render a contiguous range of PDF pages to PNG bytes with pypdfium2.
+
+    Module-level so it can run in a worker process.
+
+    Args:
+        content: PDF file bytes
+        start: First zero-based page to render
+        stop: Page index to stop before
+        dpi: Rendering resolution
+
+    Returns:
+        PNG image bytes for each page in the range
+    """
+    images = []
+    pdf = pdfium.PdfDocument(content)
+    try:
+        # Without a form environment PDFium skips AcroForm widgets, dropping
+        # the filled-in values of intake forms from the page images
+        pdf.init_forms()
+        for page_index in range(start, stop):
+            page = pdf[page_index]
+            try:
+                # PDF user space is 72 points per inch
+                images.append(_to_png(page.render(scale=dpi / 72).to_pil()))
+            finally:
+                page.close()
+    finally:
+        pdf.close()
+    return images
+
+
+def _to_png(img: Image.Image) -> bytes:
+    """Encode a PIL Image as PNG bytes.
+
+    Uses the fastest zlib level: pages are sent straight to the OCR provider
+    and never stored, so encode time matters more than a few extra bytes.
+
+    Args:
+        img: Image to encode
+
+    Returns:
+        PNG image bytes
+    """
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG", compress_level=1)
+    return buffer.getvalue()
+
+
+def _convert_standard_image(content: bytes, file_type: str) -> list[bytes]:
     """Convert standard image formats to PNG.
 
     Args:
         content: Image file bytes
+        file_type: Type reported by _detect_file_type
 
     Returns:
         List with single PNG image bytes
     """
+    if file_type == "png" and _is_plain_png(content):
+        logger.debug("Image is already a plain 8-bit RGB/grayscale PNG, using as-is")
+        return [content]
+
     logger.debug("Converting standard image to PNG")
 
     # Open and convert to RGB if needed
     img = Image.open(io.BytesIO(content))
 
-    # Convert to RGB if necessary (e.g., from RGBA or palette)
-    if img.mode not in ("RGB", "L"):
+    # Flatten transparency onto white; a plain convert drops alpha and leaves
+    # whatever color sits under transparent pixels, often black
+    if img.mode == "RGBA":
+        background = Image.new("RGB", img.size, "white")
+        background.paste(img, mask=img.getchannel("A"))
+        img = background
+    # Convert to RGB if necessary (e.g., from palette)
+    elif img.mode not in ("RGB", "L"):
         img = img.convert("RGB")
 
-    # Save as PNG
-    buffer = io.BytesIO()
-    img.save(buffer, format="PNG")
+    return [_to_png(img)]
 
-    return [buffer.getvalue()]
+
+def _is_plain_png(content: bytes) -> bool:
+    """Check whether a PNG is plain 8-bit grayscale or RGB with no ancillary metadata.
+
+    Such files hold nothing the PNG conversion would change or strip, so
+    they can be passed through without re-encoding.
+
+    Args:
+        content: PNG file bytes
+
+    Returns:
+        True if the IHDR chunk reports bit depth 8 and color type 0 or 2 and
+        every chunk is in _PLAIN_PNG_CHUNKS
+    """
+    # Signature (8) + IHDR length/type (8) + width/height (8), then depth and color type
+    if content[12:16] != b"IHDR" or content[24:26] not in _PLAIN_PNG_DEPTH_AND_COLOR:
+        return False
+
+    # Each chunk is length (4) + type (4) + data + CRC (4)
+    offset = 8
+    while offset + 8 <= len(content):
+        chunk_type = content[offset + 4 : offset + 8]
+        if chunk_type not in _PLAIN_PNG_CHUNKS:
+            return False
+        if chunk_type == b"IEND":
+            return True
+        offset += 12 + int.from_bytes(content[offset : offset + 4], "big")
+    return False
 
 
 def _convert_heic(content: bytes) -> list[bytes]:
@@ -176,26 +313,15 @@ def _convert_heic(content: bytes) -> list[bytes]:
     """
     logger.debug("Converting HEIC image to PNG")
 
-    # Open HEIC with pillow-heif
-    heif_file = pillow_heif.read_heif(content)
-
-    # Convert to PIL Image
-    img = Image.frombytes(
-        heif_file.mode,
-        heif_file.size,
-        heif_file.data,
-        "raw",
-    )
+    # Decode with pillow-heif straight into a PIL Image, skipping the extra
+    # copy Image.frombytes makes of the decoded pixel buffer
+    img = pillow_heif.open_heif(content, convert_hdr_to_8bit=True).to_pillow()
 
     # Convert to RGB if needed
     if img.mode not in ("RGB", "L"):
         img = img.convert("RGB")
 
-    # Save as PNG
-    buffer = io.BytesIO()
-    img.save(buffer, format="PNG")
-
-    return [buffer.getvalue()]
+    return [_to_png(img)]
 
 
 def get_page_count(file_content: bytes, filename: str) -> int:
@@ -214,8 +340,6 @@ def get_page_count(file_content: bytes, filename: str) -> int:
     if file_type == "pdf":
         # Use pypdfium2 for fast page counting
         try:
-            import pypdfium2 as pdfium
-
             pdf = pdfium.PdfDocument(file_content)
             return len(pdf)
         except Exception:
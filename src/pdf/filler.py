@@ -1,7 +1,9 @@
 """PDF form filling utilities using AcroForm."""
 
 import io
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 from pypdf import PdfReader, PdfWriter
@@ -10,6 +12,12 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Separators ignored when comparing field names ("first_name" == "First Name")
+_FIELD_SEPARATORS = str.maketrans("", "", "_ -")
+
+# Common widget-name prefixes stripped before matching ("txtName" -> "name")
+_FIELD_PREFIX_RE = re.compile(r"^(?:txt|chk|rad|cmb|field|frm)")
+
 
 class FormFillingError(Exception):
     """Exception raised when PDF form filling fails."""
@@ -48,13 +56,14 @@ def get_form_fields(pdf_content: bytes) -> list[FormField]:
     """
     try:
         reader = PdfReader(io.BytesIO(pdf_content))
+        pdf_fields = reader.get_fields()
 
-        if not reader.get_fields():
+        if not pdf_fields:
             logger.warning("PDF has no form fields")
             return []
 
         fields = []
-        for field_name, field_obj in reader.get_fields().items():
+        for field_name, field_obj in pdf_fields.items():
             field_type = _get_field_type(field_obj)
             current_value = field_obj.get("/V")
             options = None
@@ -120,36 +129,45 @@ def fill_pdf_form(
 
     try:
         reader = PdfReader(io.BytesIO(pdf_content))
-        writer = PdfWriter()
-
-        # Clone the PDF
-        writer.append(reader)
 
-        # Get available form fields
+        # Get available form fields before paying for a clone of the document
         pdf_fields = reader.get_fields() or {}
 
         if not pdf_fields:
             logger.warning("PDF has no fillable form fields")
             return pdf_content
 
+        # Clone the PDF
+        writer = PdfWriter()
+        writer.append(reader)
+
         # Create field name mapping (case-insensitive, normalized)
-        field_mapping = _create_field_mapping(pdf_fields.keys(), field_values.keys())
+        field_mapping = _create_field_mapping(tuple(pdf_fields), tuple(field_values))
 
-        # Fill matched fields
-        filled_count = 0
+        # Format matched values, then fill them in one pass over the page annotations
+        updates: dict[str, str] = {}
         for pdf_field_name, data_field_name in field_mapping.items():
             value = field_values.get(data_field_name)
-
             if value is not None:
-                try:
-                    formatted_value = _format_field_value(value, pdf_fields.get(pdf_field_name))
-                    writer.update_page_form_field_values(
-                        writer.pages[0] if len(writer.pages) == 1 else None,
-                        {pdf_field_name: formatted_value},
-                    )
-                    filled_count += 1
-                except Exception as e:
-                    logger.warning(f"Failed to fill field {pdf_field_name}", error=str(e))
+                updates[pdf_field_name] = _format_field_value(value, pdf_fields.get(pdf_field_name))
+
+        target_page = writer.pages[0] if len(writer.pages) == 1 else None
+        filled_count = 0
+        if updates:
+            try:
+                writer.update_page_form_field_values(target_page, updates)
+                filled_count = len(updates)
+            except Exception as e:
+                # Fall back to field-by-field so one bad field doesn't block the rest
+                logger.warning("Batch form fill failed, filling fields individually", error=str(e))
+                for pdf_field_name, formatted_value in updates.items():
+                    try:
+                        writer.update_page_form_field_values(
+                            target_page, {pdf_field_name: formatted_value}
+                        )
+                        filled_count += 1
+                    except Exception as e:
+                        logger.warning(f"Failed to fill field {pdf_field_name}", error=str(e))
 
         logger.info(
             "Filled form fields",
@@ -203,9 +221,10 @@ def _get_field_type(field_obj: dict) -> str:
     return "unknown"
 
 
+@lru_cache(maxsize=256)
 def _create_field_mapping(
-    pdf_fields: list[str],
-    data_fields: list[str],
+    pdf_fields: tuple[str, ...],
+    data_fields: tuple[str, ...],
 ) -> dict[str, str]:
     """Create mapping between PDF field names and data field names.
 
@@ -214,6 +233,9 @@ def _create_field_mapping(
     - Underscores vs spaces: "first_name" matches "first name"
     - Common prefixes: "txt_name" matches "name"
 
+    Results are cached, since the same template is filled with the same
+    extracted field names over and over; treat the returned dict as read-only.
+
     Args:
         pdf_fields: Field names from the PDF
         data_fields: Field names from extracted data
@@ -223,26 +245,17 @@ def _create_field_mapping(
     """
     mapping = {}
 
-    # Normalize field names for comparison
-    def normalize(name: str) -> str:
-        return name.lower().replace("_", "").replace(" ", "").replace("-", "")
-
-    # Remove common prefixes
-    def strip_prefix(name: str) -> str:
-        prefixes = ["txt", "chk", "rad", "cmb", "field", "frm"]
-        normalized = normalize(name)
-        for prefix in prefixes:
-            if normalized.startswith(prefix):
-                return normalized[len(prefix) :]
-        return normalized
-
-    # Create normalized lookup for data fields
-    data_lookup = {normalize(f): f for f in data_fields}
-    data_lookup_stripped = {strip_prefix(f): f for f in data_fields}
+    # Create normalized lookups for data fields, normalizing each name once
+    data_lookup = {}
+    data_lookup_stripped = {}
+    for f in data_fields:
+        normalized = _normalize_field_name(f)
+        data_lookup[normalized] = f
+        data_lookup_stripped[_FIELD_PREFIX_RE.sub("", normalized, count=1)] = f
 
     for pdf_field in pdf_fields:
-        normalized = normalize(pdf_field)
-        stripped = strip_prefix(pdf_field)
+        normalized = _normalize_field_name(pdf_field)
+        stripped = _FIELD_PREFIX_RE.sub("", normalized, count=1)
 
         # Try exact normalized match
         if normalized in data_lookup:
@@ -257,6 +270,11 @@ def _create_field_mapping(
     return mapping
 
 
+def _normalize_field_name(name: str) -> str:
+    """Normalize a field name for comparison: drop separators and lowercase."""
+    return name.translate(_FIELD_SEPARATORS).lower()
+
+
 def _format_field_value(value: Any, field_obj: dict | None) -> str:
     """Format a value for PDF form field.
 
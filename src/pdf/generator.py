@@ -5,7 +5,9 @@ that organizes extracted fields into logical sections.
 """
 
 import io
+import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 from reportlab.lib import colors
@@ -182,6 +184,27 @@ SECTION_MAPPINGS = {
     },
 }
 
+# Order sections appear in the generated PDF. This differs from SECTION_MAPPINGS,
+# whose order sets keyword matching priority (symptoms are shown before history).
+SECTION_ORDER = (
+    "patient_info",
+    "emergency_contact",
+    "insurance",
+    "symptoms",
+    "medical_history",
+    "medications",
+    "family_history",
+    "lifestyle",
+    "consent",
+)
+
+# One alternation per section, so each section's keywords are checked in a
+# single regex search instead of one substring test per keyword
+_SECTION_KEYWORD_RES = tuple(
+    (section_id, re.compile("|".join(map(re.escape, config["keywords"]))))
+    for section_id, config in SECTION_MAPPINGS.items()
+)
+
 
 def categorize_fields(fields: list[dict]) -> dict[str, FormSection]:
     """Categorize extracted fields into logical sections.
@@ -190,33 +213,30 @@ def categorize_fields(fields: list[dict]) -> dict[str, FormSection]:
         fields: List of field dictionaries with 'name' and 'value'
 
     Returns:
-        Dictionary of section_id -> FormSection
+        Dictionary of section_id -> FormSection, holding only non-empty
+        sections in SECTION_ORDER with "other" last
     """
-    sections: dict[str, FormSection] = {}
+    sections = {
+        section_id: FormSection(title=SECTION_MAPPINGS[section_id]["title"])
+        for section_id in SECTION_ORDER
+    }
     uncategorized = FormSection(title="Other Information")
 
-    for f in fields:
-        field_name = f.get("name", "").lower()
-        field_value = f.get("value")
-
-        if not field_value:
-            continue
-
-        categorized = False
-        for section_id, section_config in SECTION_MAPPINGS.items():
-            for keyword in section_config["keywords"]:
-                if keyword in field_name:
-                    if section_id not in sections:
-                        sections[section_id] = FormSection(title=section_config["title"])
-                    sections[section_id].fields.append(f)
-                    categorized = True
-                    break
-            if categorized:
-                break
+    # Drop empty values up front and lowercase each remaining name once
+    entries = [(f, f.get("name", "").lower()) for f in fields if f.get("value")]
 
-        if not categorized:
+    for f, field_name in entries:
+        # First section (in SECTION_MAPPINGS order) with a keyword in the name wins
+        for section_id, keyword_re in _SECTION_KEYWORD_RES:
+            if keyword_re.search(field_name):
+                sections[section_id].fields.append(f)
+                break
+        else:
             uncategorized.fields.append(f)
 
+    # Keep display order, dropping sections nothing matched
+    sections = {k: v for k, v in sections.items() if v.fields}
+
     # Add uncategorized if it has fields
     if uncategorized.fields:
         sections["other"] = uncategorized
@@ -224,9 +244,12 @@ def categorize_fields(fields: list[dict]) -> dict[str, FormSection]:
     return sections
 
 
+@lru_cache(maxsize=512)
 def format_field_name(name: str) -> str:
     """Convert snake_case to Title Case.
 
+    Cached, since the same extracted field names recur across documents.
+
     Args:
         name: Field name in snake_case
 
@@ -236,6 +259,69 @@ def format_field_name(name: str) -> str:
     return name.replace("_", " ").title()
 
 
+def _display_value(value: Any, limit: int = 100) -> str:
+    """Render a field value for the PDF table, truncating long values.
+
+    Args:
+        value: Extracted field value
+        limit: Maximum length, including the "..." suffix
+
+    Returns:
+        Value as a string of at most limit characters
+    """
+    text = value if isinstance(value, str) else str(value)
+    return text if len(text) <= limit else f"{text[: limit - 3]}..."
+
+
+# Styles are identical for every document, so they are built once at import
+_STYLES = getSampleStyleSheet()
+
+_TITLE_COLOR = colors.HexColor("#1a365d")
+_SECTION_COLOR = colors.HexColor("#2c5282")
+_LABEL_BACKGROUND = colors.HexColor("#f7fafc")
+_LABEL_TEXT_COLOR = colors.HexColor("#2d3748")
+_GRID_COLOR = colors.HexColor("#e2e8f0")
+
+_TITLE_STYLE = ParagraphStyle(
+    "CustomTitle",
+    parent=_STYLES["Heading1"],
+    fontSize=18,
+    spaceAfter=20,
+    textColor=_TITLE_COLOR,
+)
+
+_SECTION_STYLE = ParagraphStyle(
+    "SectionHeader",
+    parent=_STYLES["Heading2"],
+    fontSize=14,
+    spaceBefore=15,
+    spaceAfter=10,
+    textColor=_SECTION_COLOR,
+    borderColor=_SECTION_COLOR,
+    borderWidth=0,
+    borderPadding=5,
+)
+
+_TABLE_STYLE = TableStyle(
+    [
+        # Header styling (first row)
+        ("BACKGROUND", (0, 0), (0, -1), _LABEL_BACKGROUND),
+        ("TEXTCOLOR", (0, 0), (0, -1), _LABEL_TEXT_COLOR),
+        ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 10),
+        # Cell styling
+        ("ALIGN", (0, 0), (0, -1), "RIGHT"),
+        ("ALIGN", (1, 0), (1, -1), "LEFT"),
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+        ("PADDING", (0, 0), (-1, -1), 8),
+        # Grid
+        ("GRID", (0, 0), (-1, -1), 0.5, _GRID_COLOR),
+        # Alternate row colors
+        ("ROWBACKGROUNDS", (0, 0), (-1, -1), [colors.white, _LABEL_BACKGROUND]),
+    ]
+)
+
+
 def generate_pdf(
     fields: list[dict],
     title: str = "Medical Intake Form",
@@ -266,77 +352,26 @@ def generate_pdf(
         bottomMargin=0.75 * inch,
     )
 
-    # Get styles
-    styles = getSampleStyleSheet()
-
-    # Custom styles
-    title_style = ParagraphStyle(
-        "CustomTitle",
-        parent=styles["Heading1"],
-        fontSize=18,
-        spaceAfter=20,
-        textColor=colors.HexColor("#1a365d"),
-    )
-
-    section_style = ParagraphStyle(
-        "SectionHeader",
-        parent=styles["Heading2"],
-        fontSize=14,
-        spaceBefore=15,
-        spaceAfter=10,
-        textColor=colors.HexColor("#2c5282"),
-        borderColor=colors.HexColor("#2c5282"),
-        borderWidth=0,
-        borderPadding=5,
-    )
-
     # Build content
     story = []
 
     # Title
-    story.append(Paragraph(title, title_style))
+    story.append(Paragraph(title, _TITLE_STYLE))
     story.append(Spacer(1, 0.2 * inch))
 
     # Categorize fields into sections
     sections = categorize_fields(fields)
 
-    # Define section order
-    section_order = [
-        "patient_info",
-        "emergency_contact",
-        "insurance",
-        "symptoms",
-        "medical_history",
-        "medications",
-        "family_history",
-        "lifestyle",
-        "consent",
-        "other",
-    ]
-
-    # Build each section
-    for section_id in section_order:
-        if section_id not in sections:
-            continue
-
-        section = sections[section_id]
-        if not section.fields:
-            continue
-
+    # Sections come back non-empty and already in display order
+    for section in sections.values():
         # Section header
-        story.append(Paragraph(section.title, section_style))
+        story.append(Paragraph(section.title, _SECTION_STYLE))
 
         # Create table data for this section
-        table_data = []
-        for f in section.fields:
-            field_name = format_field_name(f.get("name", "Unknown"))
-            field_value = str(f.get("value", ""))
-
-            # Truncate long values
-            if len(field_value) > 100:
-                field_value = field_value[:97] + "..."
-
-            table_data.append([field_name, field_value])
+        table_data = [
+            [format_field_name(f.get("name", "Unknown")), _display_value(f.get("value", ""))]
+            for f in section.fields
+        ]
 
         if table_data:
             # Create table
@@ -346,31 +381,7 @@ def generate_pdf(
                 repeatRows=0,
             )
 
-            table.setStyle(
-                TableStyle(
-                    [
-                        # Header styling (first row)
-                        ("BACKGROUND", (0, 0), (0, -1), colors.HexColor("#f7fafc")),
-                        ("TEXTCOLOR", (0, 0), (0, -1), colors.HexColor("#2d3748")),
-                        ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
-                        ("FONTSIZE", (0, 0), (-1, -1), 10),
-                        # Cell styling
-                        ("ALIGN", (0, 0), (0, -1), "RIGHT"),
-                        ("ALIGN", (1, 0), (1, -1), "LEFT"),
-                        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                        ("PADDING", (0, 0), (-1, -1), 8),
-                        # Grid
-                        ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor("#e2e8f0")),
-                        # Alternate row colors
-                        (
-                            "ROWBACKGROUNDS",
-                            (0, 0),
-                            (-1, -1),
-                            [colors.white, colors.HexColor("#f7fafc")],
-                        ),
-                    ]
-                )
-            )
+            table.setStyle(_TABLE_STYLE)
 
             story.append(table)
             story.append(Spacer(1, 0.15 * inch))
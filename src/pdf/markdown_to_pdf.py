@@ -13,6 +13,28 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Numbered list item ("3. text") and markdown table separator row ("|---|:--|")
+_NUMBERED_ITEM_RE = re.compile(r"(\d+)\.\s(.+)")
+_TABLE_SEPARATOR_RE = re.compile(r"\|[\s\-:]+\|")
+
+# Checkbox glyphs OCR emits, spelled out since the built-in fonts lack them
+_CHECKBOX_TRANSLATION = str.maketrans({"☑": "[X]", "☐": "[ ]"})
+
+
+def _clean_text(text: str) -> str:
+    """Make text safe for FPDF's built-in latin-1 fonts.
+
+    Args:
+        text: Text to render
+
+    Returns:
+        Text with checkboxes spelled out and non-latin-1 characters replaced by "?"
+    """
+    text = text.translate(_CHECKBOX_TRANSLATION)
+    if text.isascii():
+        return text
+    return text.encode("latin-1", errors="replace").decode("latin-1")
+
 
 class MarkdownPDF(FPDF):
     """FPDF subclass for rendering markdown content."""
@@ -34,8 +56,7 @@ class MarkdownPDF(FPDF):
             self.set_text_color(26, 54, 93)  # Dark blue
             # Clean and truncate
             text = text[:150] if len(text) > 150 else text
-            text = text.replace("☑", "[X]").replace("☐", "[ ]")
-            text = text.encode("latin-1", errors="replace").decode("latin-1")
+            text = _clean_text(text)
             self.multi_cell(0, 10, text)
             self.ln(2)
             # Add underline
@@ -62,8 +83,7 @@ class MarkdownPDF(FPDF):
             self.ln(3)
             # Clean and truncate
             text = text[:200] if len(text) > 200 else text
-            text = text.replace("☑", "[X]").replace("☐", "[ ]")
-            text = text.encode("latin-1", errors="replace").decode("latin-1")
+            text = _clean_text(text)
             self.multi_cell(0, 7, text)
             self.ln(2)
             self.set_text_color(0, 0, 0)
@@ -75,10 +95,8 @@ class MarkdownPDF(FPDF):
     def add_paragraph(self, text: str):
         """Add a paragraph of text."""
         self.set_font("Helvetica", size=10)
-        # Handle special characters
-        text = text.replace("☑", "[X]").replace("☐", "[ ]")
-        # Remove any problematic characters
-        text = text.encode("latin-1", errors="replace").decode("latin-1")
+        # Handle special characters and remove any problematic ones
+        text = _clean_text(text)
         # Split very long words
         if text and len(text) > 0:
             try:
@@ -106,8 +124,7 @@ class MarkdownPDF(FPDF):
                 self.set_font("Helvetica", "B", 8)
                 self.set_fill_color(247, 250, 252)
                 for cell in rows[0]:
-                    cell_text = str(cell).replace("☑", "[X]").replace("☐", "[ ]")
-                    cell_text = cell_text.encode("latin-1", errors="replace").decode("latin-1")
+                    cell_text = _clean_text(str(cell))
                     self.cell(col_width, 7, cell_text[:25], border=1, fill=True)
                 self.ln()
 
@@ -115,8 +132,7 @@ class MarkdownPDF(FPDF):
             self.set_font("Helvetica", size=8)
             for row in rows[1:]:
                 for cell in row:
-                    cell_text = str(cell).replace("☑", "[X]").replace("☐", "[ ]")
-                    cell_text = cell_text.encode("latin-1", errors="replace").decode("latin-1")
+                    cell_text = _clean_text(str(cell))
                     self.cell(col_width, 6, cell_text[:25], border=1)
                 self.ln()
 
@@ -129,8 +145,7 @@ class MarkdownPDF(FPDF):
         """Add a list item."""
         try:
             self.set_font("Helvetica", size=10)
-            text = text.replace("☑", "[X]").replace("☐", "[ ]")
-            text = text.encode("latin-1", errors="replace").decode("latin-1")
+            text = _clean_text(text)
             self.cell(8, 5, bullet)
             self.multi_cell(0, 5, text)
         except Exception:
@@ -151,7 +166,7 @@ def parse_markdown_table(lines: list[str], start_idx: int) -> tuple[list[list[st
             break
 
         # Skip separator lines (|---|---|)
-        if re.match(r"^\|[\s\-:]+\|", line):
+        if _TABLE_SEPARATOR_RE.match(line):
             idx += 1
             continue
 
@@ -195,44 +210,42 @@ def ocr_text_to_pdf(raw_text: str, title: str = "Digitized Document") -> bytes:
             idx += 1
             continue
 
-        # H1 Title
-        if line.startswith("# "):
-            pdf.add_title(line[2:])
-            idx += 1
-            continue
-
-        # H2 Heading
-        if line.startswith("## "):
-            pdf.add_heading(line[3:], level=2)
-            idx += 1
-            continue
-
-        # H3 Heading
-        if line.startswith("### "):
-            pdf.add_heading(line[4:], level=3)
-            idx += 1
-            continue
+        # Branch on the first character so plain paragraphs, the bulk of OCR
+        # output, skip the block-syntax checks
+        first = line[0]
+
+        # Headings: "# " is the title, "## " and "### " are section headings
+        if first == "#":
+            level = len(line) - len(line.lstrip("#"))
+            if level <= 3 and line[level : level + 1] == " ":
+                if level == 1:
+                    pdf.add_title(line[2:])
+                else:
+                    pdf.add_heading(line[level + 1 :], level=level)
+                idx += 1
+                continue
 
         # Table
-        if line.startswith("|"):
+        elif first == "|":
             table_rows, idx = parse_markdown_table(lines, idx)
             if table_rows:
                 pdf.add_table(table_rows)
             continue
 
         # List item
-        if line.startswith("- ") or line.startswith("* "):
-            pdf.add_list_item(line[2:])
-            idx += 1
-            continue
+        elif first in "-*":
+            if line[1:2] == " ":
+                pdf.add_list_item(line[2:])
+                idx += 1
+                continue
 
         # Numbered list
-        if re.match(r"^\d+\.\s", line):
-            match = re.match(r"^(\d+)\.\s(.+)", line)
+        elif first.isdigit():
+            match = _NUMBERED_ITEM_RE.match(line)
             if match:
                 pdf.add_list_item(match.group(2), bullet=f"{match.group(1)}.")
-            idx += 1
-            continue
+                idx += 1
+                continue
 
         # Regular paragraph
         pdf.add_paragraph(line)
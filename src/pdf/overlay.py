@@ -4,11 +4,12 @@ This module uses PyMuPDF (fitz) to overlay typed text on regular PDFs
 at specified coordinates, enabling filling of non-fillable forms.
 """
 
-import io
+from collections import defaultdict
 from dataclasses import dataclass
 
 import fitz  # PyMuPDF
 
+from src.pdf.utils import FITZ_LOCK
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -73,65 +74,35 @@ def overlay_text_on_pdf(
         return pdf_content
 
     try:
-        # Open the PDF
-        doc = fitz.open(stream=pdf_content, filetype="pdf")
-
-        for field in fields:
-            if field.page >= len(doc):
-                logger.warning(
-                    f"Field {field.name} specifies page {field.page} but PDF only has {len(doc)} pages"
-                )
-                continue
-
-            if not field.value:
-                continue
-
-            page = doc[field.page]
-
-            # Create text insertion point
-            point = fitz.Point(field.x, field.y)
-
-            # Insert text
-            try:
-                # Use insert_text for simple single-line text
-                if field.width is None or len(field.value) < 50:
-                    page.insert_text(
-                        point,
-                        field.value,
-                        fontname=font_name,
-                        fontsize=field.font_size,
-                        color=font_color,
-                    )
-                else:
-                    # Use text box for multiline/wrapped text
-                    rect = fitz.Rect(
-                        field.x,
-                        field.y,
-                        field.x + (field.width or 200),
-                        field.y + (field.height or 50),
-                    )
-                    page.insert_textbox(
-                        rect,
-                        field.value,
-                        fontname=font_name,
-                        fontsize=field.font_size,
-                        color=font_color,
+        with FITZ_LOCK:
+            # Open the PDF
+            doc = fitz.open(stream=pdf_content, filetype="pdf")
+
+            # Group fields by page so each page is loaded once
+            page_count = len(doc)
+            fields_by_page: dict[int, list[FieldPosition]] = defaultdict(list)
+            for field in fields:
+                if field.page >= page_count:
+                    logger.warning(
+                        f"Field {field.name} specifies page {field.page} but PDF only has {page_count} pages"
                     )
+                    continue
 
-                logger.debug(
-                    f"Overlaid field {field.name} at ({field.x}, {field.y}) on page {field.page}"
-                )
+                if not field.value:
+                    continue
 
-            except Exception as e:
-                logger.warning(f"Failed to overlay field {field.name}: {e}")
+                fields_by_page[field.page].append(field)
 
-        # Save to bytes
-        output = io.BytesIO()
-        doc.save(output)
-        doc.close()
+            for page_number, page_fields in fields_by_page.items():
+                _overlay_page(doc[page_number], page_fields, font_name, font_color)
+
+            # Serialize straight to bytes; only text was added, so skip garbage
+            # collection and content cleaning, but compress the new text streams
+            pdf_bytes = doc.tobytes(garbage=0, clean=False, deflate=True)
+            doc.close()
 
         logger.info(f"Text overlay complete, overlaid {len(fields)} fields")
-        return output.getvalue()
+        return pdf_bytes
 
     except TextOverlayError:
         raise
@@ -207,18 +178,77 @@ def get_pdf_dimensions(pdf_content: bytes) -> list[dict]:
     Returns:
         List of dicts with page dimensions: {width, height, page}
     """
-    doc = fitz.open(stream=pdf_content, filetype="pdf")
-    dimensions = []
-
-    for i, page in enumerate(doc):
-        rect = page.rect
-        dimensions.append(
-            {
-                "page": i,
-                "width": rect.width,
-                "height": rect.height,
-            }
-        )
+    with FITZ_LOCK:
+        doc = fitz.open(stream=pdf_content, filetype="pdf")
+        dimensions = []
+
+        for i, page in enumerate(doc):
+            rect = page.rect
+            dimensions.append(
+                {
+                    "page": i,
+                    "width": rect.width,
+                    "height": rect.height,
+                }
+            )
 
-    doc.close()
+        doc.close()
     return dimensions
+
+
+def _overlay_page(
+    page: fitz.Page,
+    fields: list[FieldPosition],
+    font_name: str,
+    font_color: tuple[float, float, float],
+) -> None:
+    """Overlay one page's fields.
+
+    Text is written with insert_text/insert_textbox and fontname, so base-14
+    fonts such as helv are referenced by name rather than embedded in the
+    output. (A TextWriter with fitz.Font embeds a font file, about 28 KB
+    per document.)
+
+    Args:
+        page: Page to write on
+        fields: Fields on this page with non-empty values
+        font_name: Font name (helv, tiro, cour, etc.)
+        font_color: RGB color tuple (0-1 range)
+    """
+    for field in fields:
+        # Create text insertion point
+        point = fitz.Point(field.x, field.y)
+
+        # Insert text
+        try:
+            # Use insert_text for simple single-line text
+            if field.width is None or len(field.value) < 50:
+                page.insert_text(
+                    point,
+                    field.value,
+                    fontname=font_name,
+                    fontsize=field.font_size,
+                    color=font_color,
+                )
+            else:
+                # Use text box for multiline/wrapped text
+                rect = fitz.Rect(
+                    field.x,
+                    field.y,
+                    field.x + (field.width or 200),
+                    field.y + (field.height or 50),
+                )
+                page.insert_textbox(
+                    rect,
+                    field.value,
+                    fontname=font_name,
+                    fontsize=field.font_size,
+                    color=font_color,
+                )
+
+            logger.debug(
+                f"Overlaid field {field.name} at ({field.x}, {field.y}) on page {field.page}"
+            )
+
+        except Exception as e:
+            logger.warning(f"Failed to overlay field {field.name}: {e}")
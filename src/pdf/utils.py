@@ -1,6 +1,8 @@
 """PDF utility functions."""
 
 import io
+import threading
+from dataclasses import dataclass, field
 
 from pypdf import PdfReader
 
@@ -8,6 +10,73 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Stripped characters of extractable text at which a PDF is treated as born-digital
+SCANNED_TEXT_THRESHOLD = 100
+
+# PyMuPDF does not support multithreading, and its calls run in worker threads
+# (asyncio.to_thread) for several requests at once, so every PyMuPDF call made
+# off the event loop holds this lock
+FITZ_LOCK = threading.Lock()
+
+
+@dataclass
+class PdfInfo:
+    """Everything the PDF checks report, gathered from one parse.
+
+    Attributes:
+        page_count: Number of pages
+        is_encrypted: Whether the PDF is encrypted
+        form_field_count: Number of AcroForm fields
+        is_scanned: Whether the PDF appears to be a scanned document
+        document_info: Title, author, creator and producer, if the PDF has them
+    """
+
+    page_count: int
+    is_encrypted: bool
+    form_field_count: int
+    is_scanned: bool
+    document_info: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def has_form_fields(self) -> bool:
+        """Whether the PDF has fillable form fields."""
+        return self.form_field_count > 0
+
+    def to_metadata(self) -> dict:
+        """Return the dictionary shape reported by get_pdf_metadata."""
+        return {
+            "page_count": self.page_count,
+            "is_encrypted": self.is_encrypted,
+            "has_form_fields": self.has_form_fields,
+            "form_field_count": self.form_field_count,
+            **self.document_info,
+        }
+
+
+def inspect_pdf(pdf_content: bytes) -> PdfInfo:
+    """Run all PDF checks against a single parse of the file.
+
+    Use this instead of calling is_pdf_fillable, is_scanned_pdf and
+    get_pdf_metadata separately, each of which parses the PDF again.
+
+    Args:
+        pdf_content: PDF file bytes
+
+    Returns:
+        PdfInfo for the document
+
+    Raises:
+        Exception: If pypdf cannot read the PDF
+    """
+    reader = PdfReader(io.BytesIO(pdf_content))
+    return PdfInfo(
+        page_count=len(reader.pages),
+        is_encrypted=reader.is_encrypted,
+        form_field_count=len(reader.get_fields() or {}),
+        is_scanned=_is_scanned(reader),
+        document_info=_document_info(reader),
+    )
+
 
 def is_pdf_fillable(pdf_content: bytes) -> bool:
     """Check if a PDF has fillable form fields.
@@ -38,24 +107,17 @@ def get_pdf_metadata(pdf_content: bytes) -> dict:
     """
     try:
         reader = PdfReader(io.BytesIO(pdf_content))
+        fields = reader.get_fields() or {}
 
         metadata = {
             "page_count": len(reader.pages),
             "is_encrypted": reader.is_encrypted,
-            "has_form_fields": bool(reader.get_fields()),
-            "form_field_count": len(reader.get_fields() or {}),
+            "has_form_fields": bool(fields),
+            "form_field_count": len(fields),
         }
 
         # Extract document info if available
-        if reader.metadata:
-            metadata.update(
-                {
-                    "title": reader.metadata.get("/Title", ""),
-                    "author": reader.metadata.get("/Author", ""),
-                    "creator": reader.metadata.get("/Creator", ""),
-                    "producer": reader.metadata.get("/Producer", ""),
-                }
-            )
+        metadata.update(_document_info(reader))
 
         return metadata
 
@@ -78,36 +140,66 @@ def is_scanned_pdf(pdf_content: bytes) -> bool:
         True if PDF appears to be scanned
     """
     try:
-        reader = PdfReader(io.BytesIO(pdf_content))
+        return _is_scanned(PdfReader(io.BytesIO(pdf_content)))
+    except Exception as e:
+        logger.warning("Could not check if PDF is scanned", error=str(e))
+        return False
+
 
-        total_text = ""
-        has_images = False
+def _document_info(reader: PdfReader) -> dict[str, str]:
+    """Read the document info dictionary fields we report.
 
-        for page in reader.pages:
-            # Try to extract text
-            text = page.extract_text() or ""
-            total_text += text
+    Args:
+        reader: Open PDF reader
 
-            # Check for images
-            if "/XObject" in page.get("/Resources", {}):
-                xobjects = page["/Resources"]["/XObject"]
-                for obj in xobjects.values():
-                    if obj.get("/Subtype") == "/Image":
-                        has_images = True
-                        break
+    Returns:
+        Title, author, creator and producer, or an empty dict if there is no info
+    """
+    if not reader.metadata:
+        return {}
+    return {
+        "title": reader.metadata.get("/Title", ""),
+        "author": reader.metadata.get("/Author", ""),
+        "creator": reader.metadata.get("/Creator", ""),
+        "producer": reader.metadata.get("/Producer", ""),
+    }
 
-        # Consider it scanned if mostly images with little text
-        is_scanned = has_images and len(total_text.strip()) < 100
 
-        logger.debug(
-            "Scanned PDF check",
-            text_length=len(total_text),
-            has_images=has_images,
-            is_scanned=is_scanned,
-        )
+def _is_scanned(reader: PdfReader) -> bool:
+    """Check an open PDF for images with little extractable text.
 
-        return is_scanned
+    Args:
+        reader: Open PDF reader
 
-    except Exception as e:
-        logger.warning("Could not check if PDF is scanned", error=str(e))
-        return False
+    Returns:
+        True if PDF appears to be scanned
+    """
+    text_length = 0
+    has_images = False
+
+    for page in reader.pages:
+        # Try to extract text; a running length is all the check needs
+        text_length += len((page.extract_text() or "").strip())
+        if text_length >= SCANNED_TEXT_THRESHOLD:
+            # Enough real text that the PDF is not a scan, whatever else it holds
+            logger.debug("Scanned PDF check", text_length=text_length, is_scanned=False)
+            return False
+
+        # Check for images until the first one turns up, resolving each
+        # dictionary once; any() stops at the page's first image
+        if not has_images:
+            resources = page.get("/Resources") or {}
+            xobjects = resources.get("/XObject") or {}
+            has_images = any(obj.get("/Subtype") == "/Image" for obj in xobjects.values())
+
+    # Little text made it this far, so it is scanned if it has images
+    is_scanned = has_images
+
+    logger.debug(
+        "Scanned PDF check",
+        text_length=text_length,
+        has_images=has_images,
+        is_scanned=is_scanned,
+    )
+
+    return is_scanned
@@ -1,22 +1,28 @@
 """Pipeline processor - Orchestrates OCR → LLM → PDF filling."""
 
+import asyncio
 import time
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
-from src.config import LLMProvider, OCRProvider
+from src.config import LLMProvider, OCRProvider, get_settings
 from src.llm import create_llm_provider
-from src.llm.vision_extractor import VisionPositionExtractor, convert_positions_to_points
+from src.llm.vision_extractor import (
+    PositionExtractionResult,
+    VisionPositionExtractor,
+    convert_positions_to_points,
+)
 from src.ocr import create_ocr_provider
 from src.pdf.converter import convert_to_images
-from src.pdf.filler import fill_pdf_form, get_form_fields
+from src.pdf.filler import FormField, fill_pdf_form, get_form_fields
 from src.pdf.overlay import FieldPosition, overlay_text_on_pdf
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessResult:
     """Result from pipeline processing.
 
@@ -55,6 +61,35 @@ class PipelineError(Exception):
         super().__init__(f"[{stage}] {message}")
 
 
+@lru_cache(maxsize=1)
+def _conversion_slots() -> asyncio.Semaphore:
+    """Get the semaphore bounding concurrent file conversions across requests."""
+    return asyncio.Semaphore(max(1, get_settings().conversion_concurrency))
+
+
+async def _prepare_fill(
+    pdf_to_fill: bytes,
+    images: list[bytes],
+) -> tuple[list[FormField], PositionExtractionResult | None]:
+    """Read the fill target's form fields, and field positions if it has none.
+
+    Neither step depends on OCR or parsing, so this runs alongside them.
+
+    Args:
+        pdf_to_fill: PDF that Stage 4 will fill
+        images: Page images of the source document
+
+    Returns:
+        Tuple of (AcroForm fields, vision positions for an overlay fill or None)
+    """
+    form_fields = await asyncio.to_thread(get_form_fields, pdf_to_fill)
+    if form_fields:
+        return form_fields, None
+
+    logger.info("Extracting field positions with vision...")
+    return [], await VisionPositionExtractor().extract_with_positions(images)
+
+
 class PipelineProcessor:
     """Orchestrates the OCR → LLM → PDF filling pipeline.
 
@@ -101,7 +136,7 @@ class PipelineProcessor:
         Raises:
             PipelineError: If any stage of processing fails
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         logger.info(
             "Starting pipeline processing",
@@ -119,14 +154,34 @@ class PipelineProcessor:
             "template_mode": template_pdf is not None,
         }
 
+        fill_task: asyncio.Task | None = None
+        # Stage in progress, reported on PipelineError if it fails
+        stage = "conversion"
+
         try:
             # Stage 1: Convert to images
             logger.info("Stage 1: Converting file to images")
-            images = convert_to_images(file_content, filename)
+            # Rasterizing is CPU-bound, so run it off the event loop; the slots keep
+            # concurrent requests from piling renders onto the same cores
+            async with _conversion_slots():
+                images = await asyncio.to_thread(convert_to_images, file_content, filename)
             metadata["page_count"] = len(images)
             logger.info("Conversion complete", page_count=len(images))
 
+            # Determine which PDF to fill: template (if provided) or source (if PDF)
+            pdf_to_fill = (
+                template_pdf
+                if template_pdf
+                else (file_content if filename.lower().endswith(".pdf") else None)
+            )
+
+            # Start reading the fill target now so it overlaps OCR and parsing;
+            # its errors only affect filling and are reported in Stage 4
+            if pdf_to_fill:
+                fill_task = asyncio.create_task(_prepare_fill(pdf_to_fill, images))
+
             # Stage 2: OCR extraction
+            stage = "ocr"
             logger.info("Stage 2: Extracting text with OCR")
             ocr = create_ocr_provider(ocr_provider)
             ocr_result = await ocr.extract_text(images)
@@ -134,6 +189,7 @@ class PipelineProcessor:
             logger.info("OCR complete", confidence=f"{ocr_result.confidence:.2f}")
 
             # Stage 3: LLM parsing
+            stage = "parsing"
             logger.info("Stage 3: Parsing text with LLM")
             llm = create_llm_provider(llm_provider)
             parse_result = await llm.parse_to_json(ocr_result.text, field_hints)
@@ -145,28 +201,24 @@ class PipelineProcessor:
             )
 
             # Stage 4: Fill PDF form
+            stage = "pdf_filling"
             filled_pdf = None
 
-            # Determine which PDF to fill: template (if provided) or source (if PDF)
-            pdf_to_fill = (
-                template_pdf
-                if template_pdf
-                else (file_content if filename.lower().endswith(".pdf") else None)
-            )
-
             if pdf_to_fill:
                 fill_type = "template" if template_pdf else "source"
                 logger.info(f"Stage 4: Filling PDF form ({fill_type})")
 
                 # First, try AcroForm filling
                 try:
-                    form_fields = get_form_fields(pdf_to_fill)
+                    form_fields, position_result = await fill_task
                     if form_fields:
                         # PDF has AcroForm fields - use standard filling
                         logger.info(
                             f"PDF has {len(form_fields)} AcroForm fields, using field filling"
                         )
-                        filled_pdf = fill_pdf_form(pdf_to_fill, parse_result.data)
+                        filled_pdf = await asyncio.to_thread(
+                            fill_pdf_form, pdf_to_fill, parse_result.data
+                        )
                         metadata["pdf_filled"] = True
                         metadata["pdf_fill_type"] = f"{fill_type}_acroform"
                         metadata["pdf_fill_method"] = "acroform"
@@ -176,11 +228,6 @@ class PipelineProcessor:
                         logger.info("PDF has no AcroForm fields, using text overlay")
                         metadata["pdf_fill_method"] = "overlay"
 
-                        # Use vision extraction to get field positions
-                        logger.info("Extracting field positions with vision...")
-                        vision_extractor = VisionPositionExtractor()
-                        position_result = await vision_extractor.extract_with_positions(images)
-
                         if position_result.fields:
                             # Convert percentage positions to PDF points
                             field_positions = convert_positions_to_points(
@@ -189,22 +236,26 @@ class PipelineProcessor:
                             )
 
                             # Create FieldPosition objects for overlay
+                            # convert_positions_to_points sets every key, so index
+                            # directly rather than paying for .get() with defaults
                             overlay_fields = [
                                 FieldPosition(
                                     name=fp["name"],
                                     value=str(fp["value"]),
                                     x=fp["x"],
                                     y=fp["y"],
-                                    width=fp.get("width"),
-                                    height=fp.get("height"),
-                                    page=fp.get("page", 0),
-                                    font_size=fp.get("font_size", 10),
+                                    width=fp["width"],
+                                    height=fp["height"],
+                                    page=fp["page"],
+                                    font_size=fp["font_size"],
                                 )
                                 for fp in field_positions
-                                if fp.get("value")
+                                if fp["value"]
                             ]
 
-                            filled_pdf = overlay_text_on_pdf(pdf_to_fill, overlay_fields)
+                            filled_pdf = await asyncio.to_thread(
+                                overlay_text_on_pdf, pdf_to_fill, overlay_fields
+                            )
                             metadata["pdf_filled"] = True
                             metadata["pdf_fill_type"] = f"{fill_type}_overlay"
                             metadata["overlay_field_count"] = len(overlay_fields)
@@ -225,7 +276,7 @@ class PipelineProcessor:
                 logger.info("Skipping PDF filling (no template provided and input is not PDF)")
 
             # Calculate processing time
-            processing_time_ms = int((time.time() - start_time) * 1000)
+            processing_time_ms = int((time.perf_counter() - start_time) * 1000)
 
             result = ProcessResult(
                 extracted_data=parse_result.data,
@@ -246,19 +297,13 @@ class PipelineProcessor:
             return result
 
         except Exception as e:
-            processing_time_ms = int((time.time() - start_time) * 1000)
-            logger.error("Pipeline processing failed", error=str(e), stage="unknown")
-
-            # Determine which stage failed
-            stage = "unknown"
-            if "convert" in str(e).lower():
-                stage = "conversion"
-            elif "ocr" in str(e).lower():
-                stage = "ocr"
-            elif "parse" in str(e).lower() or "llm" in str(e).lower():
-                stage = "parsing"
-            elif "fill" in str(e).lower() or "pdf" in str(e).lower():
-                stage = "pdf_filling"
+            # Stop fill preparation still running for a fill that will not happen
+            if fill_task is not None:
+                fill_task.cancel()
+                await asyncio.gather(fill_task, return_exceptions=True)
+
+            processing_time_ms = int((time.perf_counter() - start_time) * 1000)
+            logger.error("Pipeline processing failed", error=str(e), stage=stage)
 
             raise PipelineError(
                 str(e),
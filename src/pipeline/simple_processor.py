@@ -8,10 +8,13 @@ This pipeline is much simpler:
 No need for: PDF-to-image conversion, page-by-page OCR, separate LLM parsing.
 """
 
+import asyncio
 import time
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
+from src.config import get_settings
 from src.ocr.mistral_document_ocr import MistralDocumentOCR, MistralOCRResult
 from src.pdf.overlay import FieldPosition, overlay_text_on_pdf
 from src.utils.logging import get_logger
@@ -19,7 +22,7 @@ from src.utils.logging import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class SimplePipelineResult:
     """Result from simplified pipeline."""
 
@@ -33,6 +36,12 @@ class SimplePipelineResult:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+@lru_cache(maxsize=1)
+def _document_slots() -> asyncio.Semaphore:
+    """Get the semaphore bounding documents in flight across requests."""
+    return asyncio.Semaphore(max(1, get_settings().max_concurrent_documents))
+
+
 class SimplePipeline:
     """Simplified OCR → Fill pipeline using Mistral Document OCR.
 
@@ -65,7 +74,18 @@ class SimplePipeline:
         Returns:
             SimplePipelineResult with extracted data and filled PDF
         """
-        start_time = time.time()
+        # Bound concurrent Mistral OCR calls and the documents held in memory
+        async with _document_slots():
+            return await self._process(source_document, source_filename, template_pdf)
+
+    async def _process(
+        self,
+        source_document: bytes,
+        source_filename: str,
+        template_pdf: bytes | None,
+    ) -> SimplePipelineResult:
+        """Run the pipeline for one document; see process()."""
+        start_time = time.perf_counter()
 
         logger.info(
             "Starting simplified pipeline",
@@ -107,26 +127,25 @@ class SimplePipeline:
                 pdf_width = 612
                 pdf_height = 792
 
-                overlay_fields = []
-                for fp in ocr_result.fields_with_positions:
-                    if not fp.get("value"):
-                        continue
-
-                    overlay_fields.append(
-                        FieldPosition(
-                            name=fp["name"],
-                            value=str(fp["value"]),
-                            x=(fp["x"] / 100) * pdf_width,
-                            y=(fp["y"] / 100) * pdf_height,
-                            width=(fp.get("width", 20) / 100) * pdf_width,
-                            height=(fp.get("height", 3) / 100) * pdf_height,
-                            page=fp.get("page", 0),
-                            font_size=10,
-                        )
+                overlay_fields = [
+                    FieldPosition(
+                        name=fp["name"],
+                        value=str(fp["value"]),
+                        x=(fp["x"] / 100) * pdf_width,
+                        y=(fp["y"] / 100) * pdf_height,
+                        width=(fp.get("width", 20) / 100) * pdf_width,
+                        height=(fp.get("height", 3) / 100) * pdf_height,
+                        page=fp.get("page", 0),
+                        font_size=10,
                     )
+                    for fp in ocr_result.fields_with_positions
+                    if fp.get("value")
+                ]
 
                 if overlay_fields:
-                    filled_pdf = overlay_text_on_pdf(template_pdf, overlay_fields)
+                    filled_pdf = await asyncio.to_thread(
+                        overlay_text_on_pdf, template_pdf, overlay_fields
+                    )
                     metadata["pdf_filled"] = True
                     metadata["overlay_field_count"] = len(overlay_fields)
                     logger.info(f"Template filled with {len(overlay_fields)} fields")
@@ -142,7 +161,7 @@ class SimplePipeline:
                 logger.info("No template provided, skipping PDF filling")
 
             # Calculate processing time
-            processing_time_ms = int((time.time() - start_time) * 1000)
+            processing_time_ms = int((time.perf_counter() - start_time) * 1000)
 
             result = SimplePipelineResult(
                 extracted_data=ocr_result.extracted_data,
@@ -163,6 +182,6 @@ class SimplePipeline:
             return result
 
         except Exception as e:
-            processing_time_ms = int((time.time() - start_time) * 1000)
+            processing_time_ms = int((time.perf_counter() - start_time) * 1000)
             logger.error("Pipeline failed", error=str(e))
             raise RuntimeError(f"Pipeline failed: {e}") from e
@@ -0,0 +1,89 @@
+"""In-memory result caches keyed by content hash.
+
+PHI Safety:
+    - Entries live only in process memory and are never written to disk
+    - Keys are hashes, so cached content cannot be recovered from a key
+    - Caches are opt-in via settings and disabled by default
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any
+
+
+def content_key(*parts: str | bytes) -> str:
+    """Build a cache key from the content that determines a result.
+
+    Each part is length-prefixed before hashing so that different splits of
+    the same bytes (e.g. ("ab", "c") and ("a", "bc")) never collide.
+
+    Args:
+        *parts: Strings or bytes identifying the cached computation
+
+    Returns:
+        Hex digest identifying the content
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        data = part.encode("utf-8") if isinstance(part, str) else part
+        digest.update(len(data).to_bytes(8, "big"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+class LRUCache:
+    """Thread-safe least-recently-used cache with a fixed number of entries.
+
+    Usage:
+        cache = LRUCache(maxsize=128)
+        cache.put(key, result)
+        result = cache.get(key)
+    """
+
+    def __init__(self, maxsize: int):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept before evicting the oldest
+        """
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        """Get a cached value and mark it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if not present
+        """
+        with self._lock:
+            try:
+                self._entries.move_to_end(key)
+            except KeyError:
+                return None
+            return self._entries[key]
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,80 @@
+"""Shared API clients for the LLM and OCR providers.
+
+Provider classes are cheap to construct, but each SDK client owns its own
+HTTP connection pool. Building a fresh client per request throws away warm
+keep-alive connections and pays a new TCP+TLS handshake on every call, so
+clients are created once per API key and reused across instances.
+"""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+import httpx
+
+if TYPE_CHECKING:
+    import google.generativeai as genai
+    from mistralai import Mistral
+    from openai import AsyncOpenAI
+
+# Connection pool limits for the async HTTP clients handed to the SDKs
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+
+def _async_http_client() -> httpx.AsyncClient:
+    """Build a pooled HTTP/2 client so concurrent calls share a few connections."""
+    return httpx.AsyncClient(http2=True, limits=HTTP_LIMITS)
+
+
+@lru_cache(maxsize=4)
+def get_openai_client(api_key: str) -> "AsyncOpenAI":
+    """Return the shared AsyncOpenAI client for an API key.
+
+    Args:
+        api_key: OpenAI API key
+
+    Returns:
+        AsyncOpenAI client backed by a pooled HTTP/2 client
+    """
+    from openai import AsyncOpenAI
+
+    return AsyncOpenAI(api_key=api_key, http_client=_async_http_client())
+
+
+@lru_cache(maxsize=4)
+def get_mistral_client(api_key: str) -> "Mistral":
+    """Return the shared Mistral client for an API key.
+
+    Args:
+        api_key: Mistral API key
+
+    Returns:
+        Mistral client whose async calls use a pooled HTTP/2 client
+    """
+    from mistralai import Mistral
+
+    return Mistral(api_key=api_key, async_client=_async_http_client())
+
+
+@lru_cache(maxsize=8)
+def get_gemini_model(
+    api_key: str,
+    model_name: str,
+    system_instruction: str | None = None,
+) -> "genai.GenerativeModel":
+    """Return a shared Gemini model for an API key and system instruction.
+
+    The google-generativeai SDK configures credentials globally, so the key
+    is applied with genai.configure before the model is built.
+
+    Args:
+        api_key: Gemini API key
+        model_name: Gemini model name
+        system_instruction: Optional system instruction baked into the model
+
+    Returns:
+        Configured GenerativeModel
+    """
+    import google.generativeai as genai
+
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(model_name, system_instruction=system_instruction)
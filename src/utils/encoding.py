@@ -0,0 +1,19 @@
+"""Helpers for encoding binary payloads sent to provider APIs."""
+
+import pybase64
+
+
+def to_data_url(content: bytes, mime_type: str) -> str:
+    """Encode bytes as a base64 data URL.
+
+    The payload is encoded straight to str, skipping the intermediate bytes
+    object and decode pass of base64.b64encode(...).decode().
+
+    Args:
+        content: Raw file bytes
+        mime_type: MIME type for the URL, e.g. "application/pdf"
+
+    Returns:
+        "data:<mime_type>;base64,<payload>" string
+    """
+    return f"data:{mime_type};base64,{pybase64.b64encode_as_string(content)}"
@@ -4,6 +4,7 @@ This module provides logging utilities that automatically redact
 Protected Health Information (PHI) to ensure HIPAA compliance.
 """
 
+import functools
 import logging
 import re
 import sys
@@ -27,6 +28,14 @@ PHI_PATTERNS = [
     (r"\b(patient|name)[:\s]+[A-Z][a-z]+\s+[A-Z][a-z]+\b", "[REDACTED-NAME]"),
 ]
 
+# Compiled once for every formatter. Applied one after another in list order:
+# each pass sees the previous redactions, which a single combined alternation
+# would not (e.g. "MRN: 12/12/2020" would keep "/12/2020").
+_COMPILED_PHI_PATTERNS = [(re.compile(p, re.IGNORECASE), r) for p, r in PHI_PATTERNS]
+
+# Every PHI pattern needs a digit, an "@" or a "patient"/"name" prefix to match
+_PHI_HINT_RE = re.compile(r"[\d@]|patient|name", re.IGNORECASE)
+
 
 class PHISafeFormatter(logging.Formatter):
     """Formatter that redacts PHI from log messages."""
@@ -39,20 +48,30 @@ class PHISafeFormatter(logging.Formatter):
     ):
         super().__init__(fmt, datefmt)
         self.redact_phi = redact_phi
-        self._compiled_patterns = [(re.compile(p, re.IGNORECASE), r) for p, r in PHI_PATTERNS]
 
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record, redacting PHI if enabled."""
         message = super().format(record)
 
-        if self.redact_phi:
+        if self.redact_phi and self._may_contain_phi(record):
             message = self._redact(message)
 
         return message
 
+    @staticmethod
+    def _may_contain_phi(record: logging.LogRecord) -> bool:
+        """Cheap check for whether redaction could change a formatted record.
+
+        The timestamp in every formatted line has digits, so the check looks at
+        the parts that can hold PHI: the message and any exception or stack text.
+        """
+        if record.exc_text or record.stack_info:
+            return True
+        return _PHI_HINT_RE.search(record.message) is not None
+
     def _redact(self, text: str) -> str:
         """Redact PHI patterns from text."""
-        for pattern, replacement in self._compiled_patterns:
+        for pattern, replacement in _COMPILED_PHI_PATTERNS:
             text = pattern.sub(replacement, text)
         return text
 
@@ -99,33 +118,39 @@ class PHISafeLogger:
             return ""
         return " | " + " ".join(f"{k}={v}" for k, v in kwargs.items())
 
+    def _log(self, level: int, message: str, kwargs: dict[str, Any], **log_kwargs: Any) -> None:
+        """Build the message and log it, skipping both if the level is disabled."""
+        if self._logger.isEnabledFor(level):
+            self._logger.log(level, f"{message}{self._format_kwargs(kwargs)}", **log_kwargs)
+
     def debug(self, message: str, **kwargs: Any) -> None:
         """Log debug message."""
-        self._logger.debug(f"{message}{self._format_kwargs(kwargs)}")
+        self._log(logging.DEBUG, message, kwargs)
 
     def info(self, message: str, **kwargs: Any) -> None:
         """Log info message."""
-        self._logger.info(f"{message}{self._format_kwargs(kwargs)}")
+        self._log(logging.INFO, message, kwargs)
 
     def warning(self, message: str, **kwargs: Any) -> None:
         """Log warning message."""
-        self._logger.warning(f"{message}{self._format_kwargs(kwargs)}")
+        self._log(logging.WARNING, message, kwargs)
 
     def error(self, message: str, **kwargs: Any) -> None:
         """Log error message."""
-        self._logger.error(f"{message}{self._format_kwargs(kwargs)}")
+        self._log(logging.ERROR, message, kwargs)
 
     def critical(self, message: str, **kwargs: Any) -> None:
         """Log critical message."""
-        self._logger.critical(f"{message}{self._format_kwargs(kwargs)}")
+        self._log(logging.CRITICAL, message, kwargs)
 
     def exception(self, message: str, **kwargs: Any) -> None:
         """Log exception with traceback."""
-        self._logger.exception(f"{message}{self._format_kwargs(kwargs)}")
+        self._log(logging.ERROR, message, kwargs, exc_info=True)
 
 
+@functools.cache
 def get_logger(name: str) -> PHISafeLogger:
-    """Get a PHI-safe logger instance.
+    """Get the PHI-safe logger for a name, created and configured on first use.
 
     Args:
         name: Logger name (typically __name__)
@@ -5,90 +5,26 @@ from fastapi.testclient import TestClient
 
 from src.main import app
 
+# Minimal 1x1 white PNG
+_SAMPLE_PNG = bytes.fromhex(
+    "89504e470d0a1a0a"  # PNG signature
+    "0000000d4948445200000001000000010802000000907753de"  # IHDR chunk
+    "0000000c4944415408d763f8ffff3f0005fe02fedccc59e7"  # IDAT chunk
+    "0000000049454e44ae426082"  # IEND chunk
+)
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the FastAPI app."""
-    return TestClient(app)
+    """Create a test client for the FastAPI app, shared across the session."""
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 @pytest.fixture
 def sample_image_bytes():
     """Generate minimal valid PNG bytes for testing."""
-    # Minimal 1x1 white PNG
-    return bytes(
-        [
-            0x89,
-            0x50,
-            0x4E,
-            0x47,
-            0x0D,
-            0x0A,
-            0x1A,
-            0x0A,  # PNG signature
-            0x00,
-            0x00,
-            0x00,
-            0x0D,
-            0x49,
-            0x48,
-            0x44,
-            0x52,  # IHDR chunk
-            0x00,
-            0x00,
-            0x00,
-            0x01,
-            0x00,
-            0x00,
-            0x00,
-            0x01,  # 1x1
-            0x08,
-            0x02,
-            0x00,
-            0x00,
-            0x00,
-            0x90,
-            0x77,
-            0x53,
-            0xDE,
-            0x00,
-            0x00,
-            0x00,
-            0x0C,
-            0x49,
-            0x44,
-            0x41,  # IDAT chunk
-            0x54,
-            0x08,
-            0xD7,
-            0x63,
-            0xF8,
-            0xFF,
-            0xFF,
-            0x3F,
-            0x00,
-            0x05,
-            0xFE,
-            0x02,
-            0xFE,
-            0xDC,
-            0xCC,
-            0x59,
-            0xE7,
-            0x00,
-            0x00,
-            0x00,
-            0x00,
-            0x49,
-            0x45,
-            0x4E,  # IEND chunk
-            0x44,
-            0xAE,
-            0x42,
-            0x60,
-            0x82,
-        ]
-    )
+    return _SAMPLE_PNG
 
 
 @pytest.fixture
@@ -0,0 +1,44 @@
+"""Fixtures for integration tests."""
+
+import pytest
+
+from src.config import get_settings
+from src.llm.base import ParseResult
+from src.ocr.base import OCRResult
+from src.pipeline import processor as processor_module
+
+
+class FakeOCR:
+    """OCR provider returning canned text without calling an API."""
+
+    async def extract_text(self, images: list[bytes]) -> OCRResult:
+        return OCRResult(
+            text="Patient Name: Jane Doe",
+            pages=["Patient Name: Jane Doe"] * len(images),
+            confidence=0.9,
+            page_confidences=[0.9] * len(images),
+            metadata={"model": "fake-ocr"},
+        )
+
+
+class FakeLLM:
+    """LLM provider returning canned structured data without calling an API."""
+
+    async def parse_to_json(self, text: str, field_hints: list[str] | None = None) -> ParseResult:
+        return ParseResult(
+            data={"patient_name": "Jane Doe"},
+            field_confidences={"patient_name": 0.8},
+            overall_confidence=0.8,
+            metadata={"model": "fake-llm"},
+        )
+
+
+@pytest.fixture
+def fake_providers(monkeypatch):
+    """Route the pipeline's OCR and LLM provider factories to in-memory fakes.
+
+    A dummy Gemini key satisfies the router's provider configuration check.
+    """
+    monkeypatch.setattr(get_settings(), "gemini_api_key", "test-key")
+    monkeypatch.setattr(processor_module, "create_ocr_provider", lambda provider: FakeOCR())
+    monkeypatch.setattr(processor_module, "create_llm_provider", lambda provider: FakeLLM())
@@ -0,0 +1,54 @@
+"""Unit tests for API response models."""
+
+import base64
+import json
+
+from src.api.models import ProcessResponse
+from src.pipeline.processor import ProcessResult
+
+
+class TestProcessResponse:
+    """Tests for ProcessResponse construction."""
+
+    def test_from_process_result_populates_fields(self):
+        """Test all response fields are populated from the pipeline result."""
+        result = ProcessResult(
+            extracted_data={"patient_name": "John Doe"},
+            filled_pdf=b"%PDF-1.4 test",
+            ocr_confidence=0.9,
+            llm_confidence=0.8,
+            field_confidences={"patient_name": 0.95},
+            processing_time_ms=1234,
+            metadata={"ocr_provider": "mistral"},
+        )
+
+        response = ProcessResponse.from_process_result(result)
+
+        assert response.extracted_data == {"patient_name": "John Doe"}
+        assert base64.b64decode(response.filled_pdf_base64) == b"%PDF-1.4 test"
+        assert response.confidence_score == result.overall_confidence
+        assert response.ocr_confidence == 0.9
+        assert response.llm_confidence == 0.8
+        assert response.field_confidences == {"patient_name": 0.95}
+        assert response.processing_time_ms == 1234
+        assert response.metadata == {"ocr_provider": "mistral"}
+        assert set(response.model_fields_set) == set(ProcessResponse.model_fields)
+
+    def test_filled_pdf_is_serialized_as_base64(self):
+        """Test the lazily encoded PDF is included in the JSON output."""
+        result = ProcessResult(extracted_data={}, filled_pdf=b"%PDF-1.4 test")
+
+        response = ProcessResponse.from_process_result(result)
+        dumped = json.loads(response.model_dump_json())
+
+        assert base64.b64decode(dumped["filled_pdf_base64"]) == b"%PDF-1.4 test"
+
+    def test_from_process_result_without_pdf(self):
+        """Test response has no PDF when the pipeline produced none."""
+        result = ProcessResult(extracted_data={"name": "Jane"})
+
+        response = ProcessResponse.from_process_result(result)
+
+        assert response.filled_pdf_base64 is None
+        assert response.field_confidences == {}
+        assert response.model_dump()["extracted_data"] == {"name": "Jane"}
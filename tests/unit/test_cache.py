@@ -0,0 +1,40 @@
+"""Unit tests for in-memory result caches."""
+
+from src.utils.cache import LRUCache, content_key
+
+
+class TestContentKey:
+    """Tests for content-addressed cache keys."""
+
+    def test_same_content_same_key(self):
+        """Test identical parts produce identical keys."""
+        assert content_key("gemini", "text") == content_key("gemini", "text")
+
+    def test_part_boundaries_are_significant(self):
+        """Test that shifting bytes between parts changes the key."""
+        assert content_key("ab", "c") != content_key("a", "bc")
+
+    def test_str_and_bytes_are_equivalent(self):
+        """Test str parts are hashed as their UTF-8 encoding."""
+        assert content_key("naïve") == content_key("naïve".encode())
+
+
+class TestLRUCache:
+    """Tests for LRUCache."""
+
+    def test_get_missing_returns_none(self):
+        """Test missing keys return None."""
+        assert LRUCache(maxsize=2).get("missing") is None
+
+    def test_evicts_least_recently_used(self):
+        """Test the oldest untouched entry is evicted when full."""
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        assert len(cache) == 2
@@ -0,0 +1,25 @@
+"""Unit tests for shared provider clients."""
+
+from src.utils.clients import get_mistral_client, get_openai_client
+
+
+class TestSharedClients:
+    """Tests for per-key client reuse."""
+
+    def test_same_key_reuses_client(self):
+        """Test repeated lookups for one key return the same client."""
+        assert get_openai_client("sk-test") is get_openai_client("sk-test")
+
+    def test_different_keys_get_separate_clients(self):
+        """Test clients are not shared across API keys."""
+        assert get_openai_client("sk-one") is not get_openai_client("sk-two")
+
+    def test_mistral_client_reused_across_providers(self):
+        """Test page OCR and vision extraction share one Mistral client per key."""
+        from src.llm.vision_extractor import VisionPositionExtractor
+        from src.ocr.mistral_ocr import MistralOCR
+
+        ocr = MistralOCR(api_key="mk-test")
+        vision = VisionPositionExtractor(api_key="mk-test")
+
+        assert ocr._client is vision._client is get_mistral_client("mk-test")
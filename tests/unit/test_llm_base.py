@@ -1,8 +1,75 @@
 """Unit tests for LLM base classes and interfaces."""
 
+import asyncio
+import json
+
 import pytest
 
-from src.llm.base import BaseLLM, LLMError, ParseResult
+from src.config import get_settings
+from src.llm.base import BaseLLM, LLMError, ParseResult, StructuredLLMBase
+from src.llm.rate_limiter import AsyncLeakyBucket
+
+
+class MockLLM(BaseLLM):
+    """Minimal complete LLM provider."""
+
+    @property
+    def provider_name(self) -> str:
+        return "mock"
+
+    async def parse_to_json(
+        self, ocr_text: str, field_hints: list[str] | None = None
+    ) -> ParseResult:
+        return ParseResult(
+            data={"parsed": True},
+            overall_confidence=0.9,
+        )
+
+
+class TinyBudgetLLM(MockLLM):
+    """LLM provider with a two-token input budget."""
+
+    MAX_INPUT_TOKENS = 2
+
+
+class SlowLLM(MockLLM):
+    """LLM provider that sleeps for the delay given as the text and tracks concurrency."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def parse_to_json(
+        self, ocr_text: str, field_hints: list[str] | None = None
+    ) -> ParseResult:
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        await asyncio.sleep(float(ocr_text))
+        self.in_flight -= 1
+        return ParseResult(data={"text": ocr_text})
+
+
+class StubStructuredLLM(StructuredLLMBase):
+    """Structured provider replaying canned model responses in order."""
+
+    def __init__(self, responses: list[str]):
+        self._model_name = "stub-model"
+        self._limiter = AsyncLeakyBucket(rpm=0, tpm=0)
+        self._responses = list(responses)
+        self.prompts: list[str] = []
+
+    @property
+    def provider_name(self) -> str:
+        return "stub"
+
+    async def _call_model(self, prompt: str) -> tuple[str, dict]:
+        self.prompts.append(prompt)
+        return self._responses.pop(0), {}
+
+
+def _document(name: str) -> dict:
+    """Build one extracted document in the batch response shape."""
+    return {"data": {"name": name}, "_field_confidences": {"name": 0.9}}
 
 
 class TestParseResult:
@@ -67,19 +134,78 @@ class TestBaseLLMInterface:
 
     def test_valid_subclass(self):
         """Test that a valid subclass can be created."""
+        llm = MockLLM()
+        assert llm.provider_name == "mock"
+
+    def test_normalize_confidences(self):
+        """Test confidences are unwrapped, clamped, summed and filtered."""
+        normalized, total = BaseLLM._normalize_confidences(
+            {
+                "name": 0.9,
+                "dob": {"confidence": 1.5},
+                "phone": {"score": -0.2},
+                "notes": "unsure",
+                "email": {"other": 0.5},
+            }
+        )
 
-        class MockLLM(BaseLLM):
-            @property
-            def provider_name(self) -> str:
-                return "mock"
+        assert normalized == {"name": 0.9, "dob": 1.0, "phone": 0.0}
+        assert total == pytest.approx(1.9)
+
+    def test_truncate_ocr_text(self):
+        """Test OCR text is cut to the estimated token budget."""
+        llm = TinyBudgetLLM()
+        assert llm._truncate_ocr_text("short") == "short"
+        assert llm._truncate_ocr_text("x" * 20) == "x" * 8
+        assert llm._truncate_ocr_text("x" * 20, max_tokens=1) == "x" * 4
+
+    async def test_parse_batch_keeps_order_within_concurrency_limit(self, monkeypatch):
+        """Test results follow input order while requests stay under max_concurrent_llm."""
+        monkeypatch.setattr(get_settings(), "max_concurrent_llm", 2)
+        llm = SlowLLM()
+        texts = ["0.05", "0.01", "0.03", "0.0", "0.02"]
+
+        results = await llm.parse_batch(texts)
+
+        assert [result.data["text"] for result in results] == texts
+        assert llm.peak_in_flight == 2
+
+
+class TestParseManyToJson:
+    """Tests for batched parsing in StructuredLLMBase."""
+
+    async def test_batch_parsed_in_one_request(self):
+        """Test a well-formed batch response is split back into per-document results."""
+        llm = StubStructuredLLM([json.dumps({"documents": [_document("Jane"), _document("John")]})])
+
+        results = await llm.parse_many_to_json(["Name: Jane", "Name: John"])
+
+        assert [result.data for result in results] == [{"name": "Jane"}, {"name": "John"}]
+        assert results[0].field_confidences == {"name": 0.9}
+        assert len(llm.prompts) == 1
+        prompt = llm.prompts[0]
+        assert prompt.index("--- DOC 1 ---") < prompt.index("Name: Jane")
+        assert prompt.index("--- DOC 2 ---") < prompt.index("Name: John")
+        assert "exactly 2 objects" in prompt
+
+    @pytest.mark.parametrize(
+        "batch_response",
+        [
+            json.dumps({"documents": [_document("Jane")]}),
+            "not json",
+        ],
+        ids=["wrong-length", "invalid-json"],
+    )
+    async def test_unusable_batch_falls_back_to_single_parses(self, batch_response):
+        """Test a batch response that cannot be matched to its documents is re-parsed singly."""
+        llm = StubStructuredLLM(
+            [batch_response, json.dumps(_document("Jane")), json.dumps(_document("John"))]
+        )
 
-            async def parse_to_json(
-                self, ocr_text: str, field_hints: list[str] | None = None
-            ) -> ParseResult:
-                return ParseResult(
-                    data={"parsed": True},
-                    overall_confidence=0.9,
-                )
+        results = await llm.parse_many_to_json(["Name: Jane", "Name: John"])
 
-        llm = MockLLM()
-        assert llm.provider_name == "mock"
+        assert [result.data for result in results] == [{"name": "Jane"}, {"name": "John"}]
+        assert len(llm.prompts) == 3
+        assert "--- DOC" not in llm.prompts[1]
+        assert "Name: Jane" in llm.prompts[1]
+        assert "Name: John" in llm.prompts[2]
@@ -0,0 +1,28 @@
+"""Unit tests for LLM JSON helpers."""
+
+import pytest
+
+from src.llm.json_utils import strip_fences
+
+
+class TestStripFences:
+    """Tests for markdown fence stripping."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            '{"a": 1}',
+            '  {"a": 1}\n',
+            '```json\n{"a": 1}\n```',
+            '```\n{"a": 1}\n```',
+            '```json{"a": 1}',
+            '{"a": 1}```',
+        ],
+    )
+    def test_strips_fences_and_whitespace(self, text):
+        """Test fenced and unfenced responses reduce to the JSON payload."""
+        assert strip_fences(text) == '{"a": 1}'
+
+    def test_keeps_inner_backticks(self):
+        """Test backticks inside the payload are preserved."""
+        assert strip_fences('```json\n{"a": "`x`"}\n```') == '{"a": "`x`"}'
@@ -0,0 +1,36 @@
+"""Unit tests for PHI-safe logging."""
+
+import logging
+import sys
+
+from src.utils.logging import PHISafeFormatter
+
+
+class TestPHIRedaction:
+    """Tests for PHI redaction in log messages."""
+
+    def test_redacts_common_phi(self):
+        """Test SSNs, phone numbers and emails are redacted."""
+        redacted = PHISafeFormatter()._redact(
+            "ssn 123-45-6789 phone 555-123-4567 mail jane@example.com"
+        )
+
+        assert redacted == "ssn [REDACTED-SSN] phone [REDACTED-PHONE] mail [REDACTED-EMAIL]"
+
+    def test_patterns_apply_in_order(self):
+        """Test an earlier pattern redacts the whole value before a later one sees it."""
+        assert PHISafeFormatter()._redact("MRN: 12/12/2020") == "MRN: [REDACTED-DATE]"
+
+    def test_exception_text_redacted_without_hints_in_message(self):
+        """Test PHI in a traceback is redacted even when the message has none."""
+        try:
+            raise ValueError("bad ssn 123-45-6789")
+        except ValueError:
+            record = logging.LogRecord(
+                "test", logging.ERROR, __file__, 1, "Failed", None, sys.exc_info()
+            )
+
+        formatted = PHISafeFormatter("%(message)s").format(record)
+
+        assert "123-45-6789" not in formatted
+        assert "[REDACTED-SSN]" in formatted
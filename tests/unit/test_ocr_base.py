@@ -5,6 +5,17 @@ import pytest
 from src.ocr.base import BaseOCR, OCRError, OCRResult
 
 
+class MockOCR(BaseOCR):
+    """Minimal complete OCR provider."""
+
+    @property
+    def provider_name(self) -> str:
+        return "mock"
+
+    async def extract_text(self, images: list[bytes]) -> OCRResult:
+        return OCRResult(text="mock text", confidence=0.9)
+
+
 class TestOCRResult:
     """Tests for OCRResult dataclass."""
 
@@ -23,13 +34,11 @@ class TestOCRResult:
         assert result.confidence == 0.85
         assert result.metadata["provider"] == "test"
 
-    def test_invalid_confidence_raises(self):
+    @pytest.mark.parametrize("confidence", [1.5, -0.1], ids=["above-one", "below-zero"])
+    def test_invalid_confidence_raises(self, confidence):
         """Test that invalid confidence raises ValueError."""
         with pytest.raises(ValueError, match="Confidence must be between"):
-            OCRResult(text="test", confidence=1.5)
-
-        with pytest.raises(ValueError, match="Confidence must be between"):
-            OCRResult(text="test", confidence=-0.1)
+            OCRResult(text="test", confidence=confidence)
 
     def test_default_values(self):
         """Test default values are set correctly."""
@@ -74,14 +83,5 @@ class TestBaseOCRInterface:
 
     def test_valid_subclass(self):
         """Test that a valid subclass can be created."""
-
-        class MockOCR(BaseOCR):
-            @property
-            def provider_name(self) -> str:
-                return "mock"
-
-            async def extract_text(self, images: list[bytes]) -> OCRResult:
-                return OCRResult(text="mock text", confidence=0.9)
-
         ocr = MockOCR()
         assert ocr.provider_name == "mock"
@@ -0,0 +1,82 @@
+"""Unit tests for PDF and image conversion."""
+
+import io
+
+import fitz
+import pytest
+from PIL import Image, PngImagePlugin
+
+from src.pdf import converter as converter_module
+from src.pdf.converter import convert_to_images
+
+
+def _filled_form_pdf(pages: int) -> bytes:
+    """Build a PDF whose pages each hold one filled-in text field."""
+    doc = fitz.open()
+    for _ in range(pages):
+        page = doc.new_page(width=300, height=100)
+        widget = fitz.Widget()
+        widget.field_type = fitz.PDF_WIDGET_TYPE_TEXT
+        widget.field_name = f"name_{page.number}"
+        widget.field_value = "JANE DOE 12345"
+        widget.rect = fitz.Rect(10, 30, 290, 70)
+        widget.text_fontsize = 24
+        page.add_widget(widget)
+    return doc.tobytes()
+
+
+def _png(**save_options) -> bytes:
+    """Encode a small 8-bit RGB PNG."""
+    buffer = io.BytesIO()
+    Image.new("RGB", (8, 8), "white").save(buffer, format="PNG", **save_options)
+    return buffer.getvalue()
+
+
+def _dark_pixel_count(png: bytes) -> int:
+    """Count the pixels darker than mid-gray in a PNG."""
+    histogram = Image.open(io.BytesIO(png)).convert("L").histogram()
+    return sum(histogram[:128])
+
+
+class TestConvertPdf:
+    """Tests for PDF page rendering."""
+
+    @pytest.mark.parametrize("workers", [1, 2], ids=["serial", "pool"])
+    def test_filled_form_fields_rendered(self, monkeypatch, workers):
+        """Test filled-in form field values appear in the rendered pages."""
+        monkeypatch.setattr(converter_module, "_RENDER_WORKERS", workers)
+        monkeypatch.setattr(
+            converter_module,
+            "convert_from_bytes",
+            lambda *args, **kwargs: pytest.fail("fell back to pdf2image"),
+        )
+
+        images = convert_to_images(_filled_form_pdf(3), "form.pdf")
+
+        assert len(images) == 3
+        assert all(_dark_pixel_count(image) > 0 for image in images)
+
+
+class TestConvertStandardImage:
+    """Tests for image uploads."""
+
+    def test_plain_png_passed_through(self):
+        """Test an 8-bit RGB PNG without ancillary metadata is returned unchanged."""
+        content = _png(dpi=(150, 150))
+
+        assert convert_to_images(content, "scan.png") == [content]
+
+    def test_png_metadata_stripped(self):
+        """Test a PNG carrying text and EXIF chunks is re-encoded without them."""
+        text = PngImagePlugin.PngInfo()
+        text.add_text("Comment", "Patient: Jane Doe")
+        exif = Image.Exif()
+        exif[0x010F] = "PhoneMaker"
+        content = _png(pnginfo=text, exif=exif)
+
+        (image,) = convert_to_images(content, "scan.png")
+
+        assert image != content
+        assert b"Jane Doe" not in image
+        assert b"PhoneMaker" not in image
+        assert b"tEXt" not in image and b"eXIf" not in image
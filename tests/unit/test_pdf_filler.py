@@ -10,8 +10,8 @@ class TestFieldMapping:
 
     def test_exact_match(self):
         """Test exact field name matching."""
-        pdf_fields = ["patient_name", "date_of_birth"]
-        data_fields = ["patient_name", "date_of_birth"]
+        pdf_fields = ("patient_name", "date_of_birth")
+        data_fields = ("patient_name", "date_of_birth")
 
         mapping = _create_field_mapping(pdf_fields, data_fields)
 
@@ -20,8 +20,8 @@ class TestFieldMapping:
 
     def test_case_insensitive_match(self):
         """Test case-insensitive matching."""
-        pdf_fields = ["PatientName", "DateOfBirth"]
-        data_fields = ["patient_name", "date_of_birth"]
+        pdf_fields = ("PatientName", "DateOfBirth")
+        data_fields = ("patient_name", "date_of_birth")
 
         mapping = _create_field_mapping(pdf_fields, data_fields)
 
@@ -30,8 +30,8 @@ class TestFieldMapping:
 
     def test_prefix_stripping(self):
         """Test that common prefixes are stripped."""
-        pdf_fields = ["txtPatientName", "chkHasDiabetes"]
-        data_fields = ["patient_name", "has_diabetes"]
+        pdf_fields = ("txtPatientName", "chkHasDiabetes")
+        data_fields = ("patient_name", "has_diabetes")
 
         mapping = _create_field_mapping(pdf_fields, data_fields)
 
@@ -40,28 +40,44 @@ class TestFieldMapping:
 
     def test_no_match_returns_empty(self):
         """Test that unmatched fields are not in mapping."""
-        pdf_fields = ["field_a"]
-        data_fields = ["completely_different"]
+        pdf_fields = ("field_a",)
+        data_fields = ("completely_different",)
 
         mapping = _create_field_mapping(pdf_fields, data_fields)
 
         assert "field_a" not in mapping
 
+    def test_repeated_mapping_is_cached(self):
+        """Test filling the same template again reuses the cached mapping."""
+        pdf_fields = ("txtPatientName", "txtDateOfBirth")
+        data_fields = ("patient_name", "date_of_birth")
 
-class TestFieldValueFormatting:
-    """Tests for field value formatting."""
+        first = _create_field_mapping(pdf_fields, data_fields)
+        hits = _create_field_mapping.cache_info().hits
+        second = _create_field_mapping(pdf_fields, data_fields)
 
-    def test_format_string(self):
-        """Test string formatting."""
-        assert _format_field_value("John Doe", None) == "John Doe"
+        assert second is first
+        assert _create_field_mapping.cache_info().hits == hits + 1
 
-    def test_format_boolean_true(self):
-        """Test boolean True formatting for checkboxes."""
-        assert _format_field_value(True, None) == "Yes"
 
-    def test_format_boolean_false(self):
-        """Test boolean False formatting for checkboxes."""
-        assert _format_field_value(False, None) == "Off"
+class TestFieldValueFormatting:
+    """Tests for field value formatting."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("John Doe", "John Doe"),
+            (True, "Yes"),
+            (False, "Off"),
+            (None, ""),
+            (42, "42"),
+            (3.14, "3.14"),
+        ],
+        ids=["string", "boolean-true", "boolean-false", "none", "int", "float"],
+    )
+    def test_format_scalar(self, value, expected):
+        """Test scalar formatting, including checkbox booleans."""
+        assert _format_field_value(value, None) == expected
 
     def test_format_list(self):
         """Test list formatting for multiline fields."""
@@ -74,12 +90,3 @@ class TestFieldValueFormatting:
         """Test dict formatting."""
         result = _format_field_value({"key": "value"}, None)
         assert "key: value" in result
-
-    def test_format_none(self):
-        """Test None formatting."""
-        assert _format_field_value(None, None) == ""
-
-    def test_format_number(self):
-        """Test number formatting."""
-        assert _format_field_value(42, None) == "42"
-        assert _format_field_value(3.14, None) == "3.14"
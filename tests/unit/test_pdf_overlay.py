@@ -0,0 +1,33 @@
+"""Unit tests for PDF text overlay."""
+
+import fitz
+
+from src.pdf.overlay import FieldPosition, overlay_text_on_pdf
+
+
+def _blank_pdf(pages: int) -> bytes:
+    """Build a PDF of blank pages."""
+    doc = fitz.open()
+    for _ in range(pages):
+        doc.new_page()
+    return doc.tobytes()
+
+
+class TestOverlayTextOnPdf:
+    """Tests for overlaying field values on regular PDFs."""
+
+    def test_text_uses_base14_font_without_embedding(self):
+        """Test overlaid text references Helvetica by name instead of embedding a font."""
+        fields = [
+            FieldPosition(name="name", value="Jane Doe", x=50, y=50),
+            FieldPosition(name="address", value="1 Main St\nSpringfield", x=50, y=80),
+            FieldPosition(name="phone", value="555-0100", x=50, y=50, page=1),
+        ]
+
+        doc = fitz.open(stream=overlay_text_on_pdf(_blank_pdf(2), fields), filetype="pdf")
+
+        fonts = {font[1:4] for page in doc for font in page.get_fonts()}
+        assert fonts == {("n/a", "Type1", "Helvetica")}
+        assert "Jane Doe" in doc[0].get_text()
+        assert "Springfield" in doc[0].get_text()
+        assert "555-0100" in doc[1].get_text()
@@ -0,0 +1,36 @@
+"""Unit tests for PDF utility functions."""
+
+import io
+
+from pypdf import PdfWriter
+
+from src.pdf.utils import get_pdf_metadata, inspect_pdf
+
+
+def _blank_pdf(pages: int) -> bytes:
+    """Build a PDF of blank pages."""
+    writer = PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(width=612, height=792)
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+class TestInspectPdf:
+    """Tests for the single-parse PDF inspection."""
+
+    def test_blank_pdf(self):
+        """Test a blank PDF has no fields and is not treated as scanned."""
+        info = inspect_pdf(_blank_pdf(3))
+
+        assert info.page_count == 3
+        assert not info.has_form_fields
+        assert info.form_field_count == 0
+        assert not info.is_scanned
+
+    def test_metadata_matches_get_pdf_metadata(self):
+        """Test PdfInfo reports the same metadata as get_pdf_metadata."""
+        pdf_content = _blank_pdf(2)
+
+        assert inspect_pdf(pdf_content).to_metadata() == get_pdf_metadata(pdf_content)
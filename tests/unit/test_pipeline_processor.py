@@ -0,0 +1,28 @@
+"""Unit tests for the pipeline processor."""
+
+import pytest
+
+from src.ocr.base import OCRError
+from src.pipeline import processor as processor_module
+from src.pipeline.processor import PipelineError, PipelineProcessor
+
+
+class _FailingOCR:
+    """OCR provider whose extraction always fails."""
+
+    async def extract_text(self, images: list[bytes]):
+        raise OCRError("Could not parse page response", "test")
+
+
+class TestPipelineErrors:
+    """Tests for failure reporting."""
+
+    async def test_error_reports_failing_stage(self, monkeypatch):
+        """Test an OCR failure is reported as the ocr stage whatever its message says."""
+        monkeypatch.setattr(processor_module, "convert_to_images", lambda content, name: [b"img"])
+        monkeypatch.setattr(processor_module, "create_ocr_provider", lambda provider: _FailingOCR())
+
+        with pytest.raises(PipelineError) as exc_info:
+            await PipelineProcessor().process(b"image", "scan.png")
+
+        assert exc_info.value.stage == "ocr"
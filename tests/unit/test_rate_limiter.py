@@ -0,0 +1,40 @@
+"""Unit tests for the LLM rate limiter."""
+
+import time
+
+from src.llm.rate_limiter import AsyncLeakyBucket
+
+
+class TestAsyncLeakyBucket:
+    """Tests for AsyncLeakyBucket."""
+
+    async def test_unlimited_does_not_wait(self):
+        """Test that a limiter with no limits never blocks."""
+        limiter = AsyncLeakyBucket(rpm=0, tpm=0)
+
+        start = time.monotonic()
+        for _ in range(100):
+            async with limiter.reserve(estimated_tokens=1000):
+                pass
+
+        assert time.monotonic() - start < 0.1
+
+    async def test_waits_when_request_budget_exhausted(self):
+        """Test that requests beyond the RPM budget wait for a refill."""
+        limiter = AsyncLeakyBucket(rpm=600, tpm=0)  # 10 requests per second
+        limiter._available_requests = 0
+
+        start = time.monotonic()
+        async with limiter.reserve():
+            pass
+
+        assert time.monotonic() - start >= 0.09
+
+    async def test_oversized_request_is_capped_to_budget(self):
+        """Test that a request larger than the TPM budget does not block forever."""
+        limiter = AsyncLeakyBucket(rpm=0, tpm=100)
+
+        async with limiter.reserve(estimated_tokens=10_000):
+            pass
+
+        assert limiter._available_tokens <= 0